@@ -1,115 +1,52 @@
 from __future__ import annotations
 
+import importlib
 import os
 import sys
 from pathlib import Path
+import queue
 import threading
-from typing import List, Optional, Dict
+from collections import deque
+from typing import TYPE_CHECKING, Callable, Deque, List, Optional, Dict
 import re
 
-import pandas as pd  # type: ignore
 import tkinter as tk
 from tkinter import filedialog, messagebox
 from tkinter import ttk
 
-from ocr_utils import (
-    collect_pdfs_in_folder,
-    ocr_pdf_to_text,
-    append_rows_csv,
-    generate_smart_patterns,
-    bulk_extract,
-    generate_window_patterns,
-    bulk_extract_licenses,
-    extract_address_between_markers,
-    extract_date_range,
-    postprocess_results,
+if TYPE_CHECKING:
+    from ocr.store import OCRStore
+
+from .common import (
+    export_results,
+    guess_poppler_bin,
+    guess_tesseract_path,
+    resource_path,
 )
 
 APP_TITLE = "EPL - OCR PDF Extractor"
-
-
-def resource_path(relative_path: str) -> str:
-    try:
-        base_path = sys._MEIPASS  # type: ignore[attr-defined]
-    except Exception:
-        base_path = os.path.abspath(".")
-    return os.path.join(base_path, relative_path)
-
-
-def bundled_poppler_path() -> str:
-    candidates = [
-        resource_path(os.path.join("poppler-25.07.0", "Library", "bin")),
-        resource_path(os.path.join("poppler", "Library", "bin")),
-        resource_path(os.path.join("poppler-25.07.0", "bin")),
-        resource_path(os.path.join("poppler", "bin")),
-    ]
-    for c in candidates:
-        if os.path.isdir(c):
-            return c
-    return ""
-
-
-def guess_tesseract_path() -> str:
-    candidates = [
-        resource_path(os.path.join("tesseract", "tesseract.exe")),
-        os.environ.get("TESSERACT_CMD", ""),
-        r"C:\\Program Files\\Tesseract-OCR\\tesseract.exe",
-        r"C:\\Program Files (x86)\\Tesseract-OCR\\tesseract.exe",
-        os.path.join(os.path.expanduser("~"), "AppData", "Local", "Programs", "Tesseract-OCR", "tesseract.exe"),
-    ]
-    for c in candidates:
-        if c and os.path.isfile(c):
-            return c
-    return ""
-
-
-def guess_poppler_bin() -> str:
-    env = os.environ.get("POPPLER_BIN", "")
-    if env and os.path.isdir(env):
-        return env
-    p = bundled_poppler_path()
-    if p:
-        return p
-    base_candidates = [r"C:\\Tools", r"C:\\Program Files"]
-    for base in base_candidates:
-        if not os.path.isdir(base):
-            continue
-        try:
-            for name in os.listdir(base):
-                if name.lower().startswith("poppler"):
-                    bin_path = os.path.join(base, name, "Library", "bin")
-                    if os.path.isdir(bin_path):
-                        return bin_path
-                    bin_path2 = os.path.join(base, name, "bin")
-                    if os.path.isdir(bin_path2):
-                        return bin_path2
-        except Exception:
-            pass
-    return ""
-
-
-def validate_paths(in_folder: str, out_file: str) -> Optional[str]:
-    if not in_folder:
-        return "Please select an input folder."
-    if not Path(in_folder).exists():
-        return "Input folder does not exist."
-    if not out_file:
-        return "Please select an output file (CSV or XLSX)."
-    out_dir = Path(out_file).parent
-    if not out_dir.exists():
-        return "Output directory does not exist."
-    if not (out_file.lower().endswith(".csv") or out_file.lower().endswith(".xlsx")):
-        return "Output file must be .csv or .xlsx"
-    return None
-
-
-def export_results(rows: List[dict], out_file: str, columns: List[str]) -> None:
-    df = pd.DataFrame(rows, columns=columns)
-    if out_file.lower().endswith(".csv"):
-        df.to_csv(out_file, index=False, encoding="utf-8")
-    else:
-        with pd.ExcelWriter(out_file, engine="openpyxl") as writer:  # type: ignore
-            df.to_excel(writer, index=False, sheet_name="Results")
+# ~30 Hz: worker events and log lines are applied to the widgets at most this often
+UI_POLL_MS = 33
+# The live OCR viewer keeps only the tail of the text
+VIEWER_MAX_CHARS = 8000
+# The log widget keeps only the most recent lines
+LOG_MAX_LINES = 2000
+# The extractor shows a PDF's text this much at a time; Tk's Text slows down on huge contents
+EXTRACTOR_CHUNK_CHARS = 200_000
+# Results-table preview of each PDF's text
+SNIPPET_CHARS = 180
+_LINE_BREAKS_TO_SPACES = {ord("\r"): " ", ord("\n"): " "}
+# Splits a selected line into the words around a field sample
+_WORD_SPLIT_RE = re.compile(r"\W+")
+
+
+def _snippet(text: str) -> str:
+    if not text:
+        return ""
+    # Only the head (with slack for leading whitespace) is cleaned up, so the cost
+    # doesn't grow with the PDF's text
+    head = text[:2 * SNIPPET_CHARS].strip().translate(_LINE_BREAKS_TO_SPACES)[:SNIPPET_CHARS]
+    return head + ("..." if len(text) > SNIPPET_CHARS else "")
 
 
 class App(tk.Tk):
@@ -158,7 +95,16 @@ class App(tk.Tk):
         self.date_context = ""
         self.ref_context = ""
         self.field_to_patterns: Dict[str, List[str]] = {}
+        # OCR texts of the last batch, on disk until the next batch replaces them
+        self._ocr_store: Optional["OCRStore"] = None
+        # UI callbacks posted by worker threads; only the Tk thread touches widgets
+        self._ui_events: "queue.Queue[Callable[[], None]]" = queue.Queue()
+        self._log_pending: Deque[str] = deque()
+        self._viewer_pending: Deque[str] = deque()
         self._build_widgets()
+        self.after(UI_POLL_MS, self._drain_ui_events)
+        # Warm up the heavy OCR imports while the window is idle instead of on the first click
+        threading.Thread(target=self._preload_backends, daemon=True).start()
 
     def _build_widgets(self) -> None:
         pad = {"padx": 6, "pady": 4}
@@ -212,9 +158,61 @@ class App(tk.Tk):
         self.grid_rowconfigure(10, weight=1)
         self.grid_columnconfigure(1, weight=1)
 
+    def _preload_backends(self) -> None:
+        self._post(lambda: self.status_var.set("Loading OCR engine..."))
+        try:
+            importlib.import_module("ocr_utils")
+        except Exception as exc:  # noqa: BLE001
+            self._append_log(f"Failed to load OCR modules: {exc}")
+        self._post(lambda: self.status_var.set("Idle") if self.status_var.get() == "Loading OCR engine..." else None)
+
+    def _post(self, callback: Callable[[], None]) -> None:
+        self._ui_events.put(callback)
+
+    def _drain_ui_events(self) -> None:
+        try:
+            while True:
+                callback = self._ui_events.get_nowait()
+                try:
+                    callback()
+                except Exception:
+                    self.report_callback_exception(*sys.exc_info())
+        except queue.Empty:
+            pass
+        self._flush_log()
+        self._flush_viewer()
+        self.after(UI_POLL_MS, self._drain_ui_events)
+
     def _append_log(self, message: str) -> None:
+        # Safe from any thread; lines are written to the widget in one batch per poll tick
+        self._log_pending.append(message)
+
+    def _append_viewer(self, page_text: str) -> None:
+        # Safe from any thread; pages are added to the viewer in one insert per poll tick
+        self._viewer_pending.append(page_text)
+
+    def _flush_viewer(self) -> None:
+        if not self._viewer_pending:
+            return
+        pages: List[str] = []
+        while self._viewer_pending:
+            pages.append(self._viewer_pending.popleft())
+        view = self.ocr_text_view
+        sep = "\n\n" if view.compare("end-1c", "!=", "1.0") else ""
+        view.insert("end", sep + "\n\n".join(pages))
+        # "end" counts Tk's trailing newline, hence the +1
+        view.delete("1.0", f"end-{VIEWER_MAX_CHARS + 1}c")
+        view.see("end")
+
+    def _flush_log(self) -> None:
+        if not self._log_pending:
+            return
+        batch: List[str] = []
+        while self._log_pending:
+            batch.append(self._log_pending.popleft())
         self.log.configure(state="normal")
-        self.log.insert("end", message + "\n")
+        self.log.insert("end", "\n".join(batch) + "\n")
+        self.log.delete("1.0", f"end-{LOG_MAX_LINES}l")
         self.log.see("end")
         self.log.configure(state="disabled")
 
@@ -250,7 +248,6 @@ class App(tk.Tk):
 
     def _run(self, run_all: bool = True) -> None:
         in_folder = self.in_folder_var.get().strip()
-        out_file = self.out_file_var.get().strip()
         tesseract_path = self.tess_path_var.get().strip() or None
         poppler_path = self.poppler_var.get().strip() or None
 
@@ -264,6 +261,7 @@ class App(tk.Tk):
             messagebox.showerror("Error", err)
             return
 
+        self._log_pending.clear()
         self.log.configure(state="normal")
         self.log.delete("1.0", "end")
         self.log.configure(state="disabled")
@@ -277,78 +275,149 @@ class App(tk.Tk):
 
         self._set_running(True)
 
-        def worker() -> None:
+        self._perform_long_operation(
+            lambda: self._run_batch(in_folder, run_all, tesseract_path, poppler_path),
+            self._on_batch_done,
+        )
+
+    def _perform_long_operation(self, func: Callable[[], object], on_done: Callable[[object], None]) -> None:
+        """
+        Run func on a worker thread and pass its result (or the exception it raised)
+        to on_done on the Tk thread, keeping the event loop live meanwhile.
+        """
+        def runner() -> None:
             try:
-                self.after(0, lambda: self._append_log(f"Scanning folder: {in_folder}"))
-                pdfs_local = collect_pdfs_in_folder(in_folder)
-                if not run_all:
-                    pdfs_local = pdfs_local[:1]
-                if not pdfs_local:
-                    self.after(0, lambda: self._append_log("No PDF files found."))
-                    self.after(0, lambda: self._set_running(False))
-                    return
-                rows_local: List[dict] = []
-                self.after(0, lambda: self.progress.configure(maximum=len(pdfs_local), value=0))
-
-                for idx, pdf_path in enumerate(pdfs_local, start=1):
-                    def pre_update() -> None:
-                        percentage = int((idx-1) * 100 / len(pdfs_local))
-                        self.status_var.set(f"Processing {pdf_path.name} ({idx}/{len(pdfs_local)}) - {percentage}%")
-                        self._append_log(f"[{idx}/{len(pdfs_local)}] Processing {pdf_path.name} ...")
-                        self.current_file_var.set(pdf_path.name)
-                    self.after(0, pre_update)
-
-                    def on_page(page_text: str, idx_page: int, total_pages: int) -> None:
-                        def update_view() -> None:
-                            existing = self.ocr_text_view.get("1.0", "end")
-                            new_text = (existing + ("\n\n" if existing.strip() else "") + page_text)[-8000:]
-                            self.ocr_text_view.delete("1.0", "end")
-                            self.ocr_text_view.insert("1.0", new_text)
-                            self.ocr_text_view.see("end")
-                        self.after(0, update_view)
+                result: object = func()
+            except Exception as exc:  # noqa: BLE001
+                result = exc
+            self._post(lambda: on_done(result))
+
+        threading.Thread(target=runner, daemon=True).start()
+
+    def _run_batch(
+        self,
+        in_folder: str,
+        run_all: bool,
+        tesseract_path: Optional[str],
+        poppler_path: Optional[str],
+    ) -> Optional["OCRStore"]:
+        from ocr_utils import OCRStore, collect_pdfs_in_folder
+
+        self._append_log(f"Scanning folder: {in_folder}")
+        pdfs_local = collect_pdfs_in_folder(in_folder)
+        if not run_all:
+            pdfs_local = pdfs_local[:1]
+        if not pdfs_local:
+            self._append_log("No PDF files found.")
+            return None
+        total = len(pdfs_local)
+        self._post(lambda: self.progress.configure(maximum=total, value=0))
+        # Texts go to disk as each PDF finishes; only the current one is held in memory
+        store = OCRStore()
+        try:
+            self._ocr_batch(pdfs_local, store, tesseract_path, poppler_path)
+        except Exception:
+            store.close()
+            raise
+        return store
+
+    def _ocr_batch(
+        self,
+        pdfs_local: List[Path],
+        store: "OCRStore",
+        tesseract_path: Optional[str],
+        poppler_path: Optional[str],
+    ) -> None:
+        from ocr_utils import default_worker_count, iter_completed, make_process_pool, ocr_pdf_to_text, sort_for_disk_locality
+
+        total = len(pdfs_local)
+
+        def post_update(done: int, name: str, full_text: str) -> None:
+            self.progress['value'] = done
+            percentage_inner = int(done * 100 / total)
+            self.status_var.set(f"Completed {name} ({done}/{total}) - {percentage_inner}%")
+            self.table.insert("", "end", values=(name, _snippet(full_text)))
+            self._append_log(f"Completed: {name}")
+
+        if total == 1:
+            # Single PDF: OCR in-process so pages stream into the live viewer
+            pdf_path = pdfs_local[0]
+
+            def pre_update() -> None:
+                self.status_var.set(f"Processing {pdf_path.name} (1/1) - 0%")
+                self.current_file_var.set(pdf_path.name)
+            self._post(pre_update)
+            self._append_log(f"[1/1] Processing {pdf_path.name} ...")
+
+            def on_page(page_text: str, idx_page: int, total_pages: int) -> None:
+                self._append_viewer(page_text)
 
+            try:
+                full_text = ocr_pdf_to_text(
+                    pdf_path,
+                    tesseract_cmd=tesseract_path,
+                    poppler_path=poppler_path,
+                    on_page=on_page,
+                    log=self._append_log,
+                )
+            except Exception as exc:  # noqa: BLE001
+                full_text = ""
+                self._append_log(f"OCR failed for {pdf_path.name}: {exc}")
+            store.put(1, pdf_path.name, full_text)
+            self._post(lambda t=full_text: post_update(1, pdf_path.name, t))
+        else:
+            # Many PDFs: one worker process per PDF, results reported as they finish
+            self._append_log(f"Processing {total} PDFs in parallel ...")
+            workers = default_worker_count(total)
+            with make_process_pool(total, max_workers=workers) as ex:
+                # Submit in on-disk order for read locality; rows are still reported by name
+                index_of = {p: idx for idx, p in enumerate(pdfs_local, start=1)}
+                jobs = (
+                    ((index_of[pdf_path], pdf_path), (str(pdf_path), tesseract_path, poppler_path))
+                    for pdf_path in sort_for_disk_locality(pdfs_local)
+                )
+                # Only a couple of PDFs per worker are queued at a time, not the whole folder
+                completed = iter_completed(ex, ocr_pdf_to_text, jobs, max_pending=2 * workers)
+                for done, ((idx, pdf_path), fut) in enumerate(completed, start=1):
                     try:
-                        full_text = ocr_pdf_to_text(
-                            pdf_path,
-                            tesseract_cmd=tesseract_path,
-                            poppler_path=poppler_path,
-                            on_page=on_page,
-                            log=lambda m: self.after(0, lambda: self._append_log(m)),
-                        )
+                        full_text = fut.result()
                     except Exception as exc:  # noqa: BLE001
                         full_text = ""
-                        self.after(0, lambda exc_msg=str(exc), fn=lambda: None: None)
-                        self.after(0, lambda e=exc: self._append_log(f"OCR failed for {pdf_path.name}: {e}"))
-
-                    rows_local.append({"File Name": pdf_path.name, "Text": full_text})
-
-                    def post_update() -> None:
-                        self.progress['value'] = idx
-                        percentage_inner = int(idx * 100 / len(pdfs_local))
-                        self.status_var.set(f"Completed {pdf_path.name} ({idx}/{len(pdfs_local)}) - {percentage_inner}%")
-                        snippet = (full_text.strip().replace("\r", " ").replace("\n", " ")[:180] + ("..." if len(full_text) > 180 else "")) if full_text else ""
-                        self.table.insert("", "end", values=(pdf_path.name, snippet))
-                        self._append_log(f"Completed: {pdf_path.name}")
-                    self.after(0, post_update)
-
-                def done_update() -> None:
-                    self.status_var.set("OCR texts ready. Use 'Select Fields (First PDF)' then 'Final Extract'.")
-                    self._ocr_rows_cache = rows_local
-                    self._set_running(False)
-                self.after(0, done_update)
-            except Exception as e:  # noqa: BLE001
-                def err_update() -> None:
-                    self._append_log(f"Processing failed: {e}")
-                    self._set_running(False)
-                self.after(0, err_update)
-
-        threading.Thread(target=worker, daemon=True).start()
+                        self._append_log(f"OCR failed for {pdf_path.name}: {exc}")
+                    store.put(idx, pdf_path.name, full_text)
+
+                    def show_latest(name: str = pdf_path.name, t: str = full_text) -> None:
+                        self.current_file_var.set(name)
+                        self.ocr_text_view.delete("1.0", "end")
+                        self.ocr_text_view.insert("1.0", t[-VIEWER_MAX_CHARS:])
+                        self.ocr_text_view.see("end")
+                    self._post(show_latest)
+                    self._post(lambda d=done, n=pdf_path.name, t=full_text: post_update(d, n, t))
+
+    def _on_batch_done(self, result: object) -> None:
+        if isinstance(result, Exception):
+            self._append_log(f"Processing failed: {result}")
+        elif result is not None:
+            self.status_var.set("OCR texts ready. Use 'Select Fields (First PDF)' then 'Final Extract'.")
+            if self._ocr_store is not None:
+                self._ocr_store.close()
+            self._ocr_store = result
+        self._set_running(False)
+
+    def destroy(self) -> None:
+        if self._ocr_store is not None:
+            self._ocr_store.close()
+            self._ocr_store = None
+        super().destroy()
 
     def _open_extractor(self) -> None:
-        rows: List[Dict[str, str]] = getattr(self, "_ocr_rows_cache", [])
-        if not rows:
+        from ocr_utils import generate_smart_patterns, generate_window_patterns
+
+        store = self._ocr_store
+        if store is None or not len(store):
             messagebox.showerror("Extractor", "Run OCR first to populate texts.")
             return
+        keys = store.keys()
 
         dlg = tk.Toplevel(self)
         dlg.title("Extractor - Define Fields by Selection")
@@ -358,11 +427,15 @@ class App(tk.Tk):
                 dlg.iconphoto(True, self.icon_img)
         except Exception:
             pass
+        # Modal: the dialog reads texts from this store, which a new 'Process All' run
+        # would close and replace
+        dlg.transient(self)
+        dlg.grab_set()
 
         file_list = tk.Listbox(dlg, width=40, exportselection=False)
         file_list.grid(row=0, column=0, rowspan=3, sticky="nsw", padx=6, pady=6)
-        for r in rows:
-            file_list.insert("end", r.get("File Name", ""))
+        for _, name in keys:
+            file_list.insert("end", name)
 
         text_view = tk.Text(dlg, width=80, height=24, exportselection=False)
         text_view.grid(row=0, column=1, columnspan=3, sticky="nsew", padx=6, pady=6)
@@ -381,18 +454,28 @@ class App(tk.Tk):
         field_to_patterns: Dict[str, List[str]] = dict(self.field_to_patterns)
         last_sel = {"start": None, "end": None}
 
+        # Text of the file on display and how much of it is in the viewer
+        shown = {"text": "", "pos": 0}
+
+        def load_more() -> None:
+            txt, pos = shown["text"], shown["pos"]
+            chunk = txt[pos:pos + EXTRACTOR_CHUNK_CHARS]
+            text_view.insert("end-1c", chunk)
+            shown["pos"] = pos + len(chunk)
+            more_btn.configure(state="normal" if shown["pos"] < len(txt) else "disabled")
+
         def refresh_text(*_args: object) -> None:
             idxs = file_list.curselection()
-            if not idxs:
-                text_view.delete("1.0", "end")
-                return
-            fn = file_list.get(idxs[0])
-            txt = next((r.get("Text", "") for r in rows if r.get("File Name") == fn), "")
             text_view.delete("1.0", "end")
-            text_view.insert("1.0", txt)
+            # The list was filled from keys in order, so the selection index picks the key
+            shown["text"] = store.get(keys[idxs[0]][0]) if idxs else ""
+            shown["pos"] = 0
+            load_more()
 
+        more_btn = tk.Button(dlg, text="Load More Text", command=load_more)
+        more_btn.grid(row=3, column=1, sticky="w", padx=6, pady=6)
         file_list.bind("<<ListboxSelect>>", refresh_text)
-        if rows:
+        if keys:
             file_list.selection_set(0)
             refresh_text()
 
@@ -436,7 +519,7 @@ class App(tk.Tk):
                 line_text = text_view.get(line_start, line_end)
             except Exception:
                 line_text = ctx or ""
-            words = [w for w in re.split(r"\W+", line_text) if w]
+            words = [w for w in _WORD_SPLIT_RE.split(line_text) if w]
             before = words[:3] if words else []
             after = words[-3:] if words else []
             pats += generate_window_patterns(sample, before_words=before, after_words=after, max_words_window=3)
@@ -462,8 +545,10 @@ class App(tk.Tk):
         tk.Button(dlg, text="Use Selection & Close", command=run_extraction).grid(row=3, column=3, sticky="e", padx=6, pady=6)
 
     def _final_extract(self) -> None:
-        rows: List[Dict[str, str]] = getattr(self, "_ocr_rows_cache", [])
-        if not rows:
+        if getattr(self, "_is_running", False):
+            return
+        store = self._ocr_store
+        if store is None or not len(store):
             messagebox.showerror("Final Extract", "Run 'Process All' first to OCR PDFs.")
             return
         out_path = self.out_file_var.get().strip()
@@ -471,12 +556,37 @@ class App(tk.Tk):
             messagebox.showerror("Final Extract", "Please set 'Output File' before exporting.")
             return
         user_patterns = dict(self.field_to_patterns)
-        results = bulk_extract(rows, user_patterns) if user_patterns else [{"File Name": r.get("File Name", "")} for r in rows]
-        lic_rows = bulk_extract_licenses(rows)
-        lic_map = {r.get("File Name", ""): r.get("Licenses", "") for r in lic_rows}
-        for r in results:
-            r["Licenses"] = lic_map.get(r.get("File Name", ""), "")
-            full_text = next((x.get("Text", "") for x in rows if x.get("File Name") == r.get("File Name")), "")
+        self._set_running(True)
+        self.status_var.set("Extracting fields...")
+        self._perform_long_operation(
+            lambda: self._extract_and_export(store, user_patterns, out_path),
+            lambda result: self._on_final_extract_done(result, out_path),
+        )
+
+    def _extract_and_export(
+        self, store: "OCRStore", user_patterns: Dict[str, List[str]], out_path: str
+    ) -> tuple[List[Dict[str, str]], List[str]]:
+        from ocr_utils import (
+            bulk_extract,
+            bulk_extract_licenses,
+            extract_address_between_markers,
+            extract_date_range,
+            make_extract_pool,
+            postprocess_results,
+        )
+
+        # One pool, if the batch is big enough to need one, serves both passes
+        pool = make_extract_pool(store.text_length())
+        try:
+            # Each pass streams the texts from the store; all three come back in batch order
+            results = bulk_extract(store.iter_rows(), user_patterns, pool) if user_patterns else [{"File Name": name} for _, name in store.keys()]
+            lic_rows = bulk_extract_licenses(store.iter_rows(), pool)
+        finally:
+            if pool is not None:
+                pool.shutdown()
+        for r, lic, row in zip(results, lic_rows, store.iter_rows()):
+            r["Licenses"] = lic.get("Licenses", "")
+            full_text = row["Text"]
             addr = extract_address_between_markers(full_text) or ""
             start_date, end_date = extract_date_range(full_text)
             r["Address"] = addr
@@ -500,25 +610,32 @@ class App(tk.Tk):
         filtered = postprocess_results(filtered, compute_new_column=None, new_column_name=new_column_name)
         cols = cols + [new_column_name]
 
+        export_results(filtered, out_path, columns=cols)
+        return filtered, cols
+
+    def _on_final_extract_done(self, result: object, out_path: str) -> None:
+        self._set_running(False)
+        self.status_var.set("Idle")
+        if isinstance(result, Exception):
+            messagebox.showerror("Final Extract", f"Failed to extract and save: {result}")
+            return
+        filtered, cols = result
+        messagebox.showinfo("Final Extract", f"Saved final output to: {out_path}")
+        for iid in self.table.get_children():
+            self.table.delete(iid)
+        self.table["columns"] = cols
+        for cid in cols:
+            self.table.heading(cid, text=cid)
+            self.table.column(cid, width=160 if cid != "File Name" else 220)
+        for r in filtered:
+            self.table.insert("", "end", values=[r.get(c, "") for c in cols])
 
-        try:
-            export_results(filtered, out_path, columns=cols)
-            messagebox.showinfo("Final Extract", f"Saved final output to: {out_path}")
-            for iid in self.table.get_children():
-                self.table.delete(iid)
-            self.table["columns"] = cols
-            for cid in cols:
-                self.table.heading(cid, text=cid)
-                self.table.column(cid, width=160 if cid != "File Name" else 220)
-            for r in filtered:
-                self.table.insert("", "end", values=[r.get(c, "") for c in cols])
-        except Exception as exc:
-            messagebox.showerror("Final Extract", f"Failed to save: {exc}")
-        
-        
 
 
 def main() -> None:
+    # Tesseract spawns several OpenMP threads per call by default, which thrashes once
+    # PDFs are OCR'd in parallel; one thread per Tesseract process is the faster combination.
+    os.environ.setdefault("OMP_THREAD_LIMIT", "1")
     app = App()
     app.mainloop()
 
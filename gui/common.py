@@ -0,0 +1,163 @@
+"""
+Helpers shared by the Tk front ends: bundled/installed tool discovery, path
+validation and result export.
+"""
+
+from __future__ import annotations
+
+import csv
+import functools
+import os
+import re
+import stat
+import sys
+from typing import Iterable, List, Optional
+
+_POPPLER_DIR_RE = re.compile(r"poppler", re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=None)
+def resource_path(relative_path: str) -> str:
+    try:
+        base_path = sys._MEIPASS  # type: ignore[attr-defined]
+    except Exception:
+        base_path = os.path.abspath(".")
+    return os.path.join(base_path, relative_path)
+
+
+@functools.lru_cache(maxsize=None)
+def bundled_poppler_path() -> str:
+    candidates = [
+        resource_path(os.path.join("poppler-25.07.0", "Library", "bin")),
+        resource_path(os.path.join("poppler", "Library", "bin")),
+        resource_path(os.path.join("poppler-25.07.0", "bin")),
+        resource_path(os.path.join("poppler", "bin")),
+    ]
+    for c in candidates:
+        if os.path.isdir(c):
+            return c
+    return ""
+
+
+@functools.lru_cache(maxsize=None)
+def guess_tesseract_path() -> str:
+    candidates = [
+        resource_path(os.path.join("tesseract", "tesseract.exe")),
+        os.environ.get("TESSERACT_CMD", ""),
+        r"C:\\Program Files\\Tesseract-OCR\\tesseract.exe",
+        r"C:\\Program Files (x86)\\Tesseract-OCR\\tesseract.exe",
+        os.path.join(os.path.expanduser("~"), "AppData", "Local", "Programs", "Tesseract-OCR", "tesseract.exe"),
+    ]
+    for c in candidates:
+        if c and os.path.isfile(c):
+            return c
+    return ""
+
+
+@functools.lru_cache(maxsize=None)
+def guess_poppler_bin() -> str:
+    env = os.environ.get("POPPLER_BIN", "")
+    if env and os.path.isdir(env):
+        return env
+    p = bundled_poppler_path()
+    if p:
+        return p
+    base_candidates = [r"C:\\Tools", r"C:\\Program Files"]
+    for base in base_candidates:
+        if not os.path.isdir(base):
+            continue
+        try:
+            with os.scandir(base) as it:
+                for entry in it:
+                    if not _POPPLER_DIR_RE.match(entry.name):
+                        continue
+                    if not entry.is_dir():
+                        continue
+                    bin_path = os.path.join(entry.path, "Library", "bin")
+                    if os.path.isdir(bin_path):
+                        return bin_path
+                    bin_path2 = os.path.join(entry.path, "bin")
+                    if os.path.isdir(bin_path2):
+                        return bin_path2
+        except Exception:
+            pass
+    return ""
+
+
+def _is_dir(path: str) -> bool:
+    try:
+        return stat.S_ISDIR(os.stat(path).st_mode)
+    except OSError:
+        return False
+
+
+def output_format(out_file: str) -> Optional[str]:
+    """"csv" or "xlsx" from the file extension, None for anything else."""
+    ext = os.path.splitext(out_file)[1].lower()
+    if ext == ".csv":
+        return "csv"
+    if ext == ".xlsx":
+        return "xlsx"
+    return None
+
+
+def validate_paths(in_folder: str, out_file: str) -> Optional[str]:
+    if not in_folder:
+        return "Please select an input folder."
+    if not out_file:
+        return "Please select an output file (CSV or XLSX)."
+    # String checks first; each directory check below is a single stat
+    if output_format(out_file) is None:
+        return "Output file must be .csv or .xlsx"
+    if not _is_dir(in_folder):
+        return "Input folder does not exist."
+    if not _is_dir(os.path.dirname(out_file) or "."):
+        return "Output directory does not exist."
+    return None
+
+
+# Export writes go through a 1 MiB buffer: a few large writes instead of one per 8 KiB
+_EXPORT_BUFFER_SIZE = 1 << 20
+
+
+def _export_csv(rows: Iterable[dict], out_file: str, columns: List[str]) -> None:
+    with open(out_file, "w", newline="", encoding="utf-8", buffering=_EXPORT_BUFFER_SIZE) as f:
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        writer.writerows([r.get(c, "") for c in columns] for r in rows)
+
+
+def _export_xlsx(rows: Iterable[dict], out_file: str, columns: List[str]) -> None:
+    try:
+        import xlsxwriter  # type: ignore
+    except ImportError:
+        xlsxwriter = None
+    if xlsxwriter is not None:
+        # constant_memory writes each row out as soon as the next one starts; OCR text
+        # is stored verbatim, never turned into formulas or links
+        wb = xlsxwriter.Workbook(
+            out_file, {"constant_memory": True, "strings_to_formulas": False, "strings_to_urls": False}
+        )
+        ws = wb.add_worksheet("Results")
+        ws.write_row(0, 0, columns)
+        for i, r in enumerate(rows, start=1):
+            ws.write_row(i, 0, [r.get(c, "") for c in columns])
+        wb.close()
+        return
+
+    from openpyxl import Workbook  # type: ignore
+
+    # write_only streams rows into the file instead of keeping every cell object in memory
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Results")
+    ws.append(columns)
+    for r in rows:
+        ws.append([r.get(c, "") for c in columns])
+    wb.save(out_file)
+
+
+def export_results(rows: Iterable[dict], out_file: str, columns: List[str], fmt: Optional[str] = None) -> None:
+    if (fmt or output_format(out_file)) == "csv":
+        _export_csv(rows, out_file, columns)
+    else:
+        _export_xlsx(rows, out_file, columns)
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+import csv
+import multiprocessing
 import os
+import queue
 import sys
+import threading
 from pathlib import Path
-from typing import List, Optional
-import re
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 
-import pandas as pd  # type: ignore
 import tkinter as tk
 from tkinter import filedialog, messagebox
 from tkinter import ttk
@@ -14,90 +16,84 @@ from tkinter import ttk
 from ocr_utils import (
     ExtractionResult,
     collect_pdfs_in_folder,
+    default_worker_count,
+    generate_smart_patterns,
+    iter_completed,
+    iter_page_texts,
+    iter_pdf_pages,
+    make_process_pool,
+    ocr_image_to_text,
+    preprocess_image,
     process_pdf_file,
 )
-from t5_extractor import extract_with_context_t5
+from gui.common import (
+    export_results as export_rows,
+    guess_poppler_bin,
+    guess_tesseract_path,
+    output_format,
+    validate_paths,
+)
 
 
 APP_TITLE = "OCR PDF Extractor (Tkinter)"
 
+# Delay before buffered log lines are written to the log widget
+LOG_FLUSH_MS = 200
+# The log widget keeps only the most recent lines
+LOG_MAX_LINES = 2000
+# How often the Tk thread picks up updates posted by the batch worker
+UI_POLL_MS = 33
+
+# Preview render resolution; batch OCR still renders at 300 DPI
+PREVIEW_DPI = 150
+PREVIEW_CACHE_SIZE = 8
+
+# Documents per batched T5 generate() call
+T5_BATCH_SIZE = 8
+
+
+EXPORT_COLUMNS = ["File Name", "License ID", "Date", "Reference ID", "Notes"]
+
+
+def _result_row(r: ExtractionResult) -> Tuple[str, ...]:
+    return (r.file_name, r.license_id or "", r.date or "", r.reference_id or "", r.notes or "")
+
+
+def export_results(rows: Iterable[Sequence[str]], out_file: str, fmt: Optional[str] = None) -> None:
+    """Write rows already flattened with _result_row, in EXPORT_COLUMNS order."""
+    export_rows((dict(zip(EXPORT_COLUMNS, row)) for row in rows), out_file, EXPORT_COLUMNS, fmt)
 
-def resource_path(relative_path: str) -> str:
-    try:
-        base_path = sys._MEIPASS  # type: ignore[attr-defined]
-    except Exception:
-        base_path = os.path.abspath(".")
-    return os.path.join(base_path, relative_path)
-
-
-def guess_tesseract_path() -> str:
-    candidates = [
-        os.environ.get("TESSERACT_CMD", ""),
-        r"C:\\Program Files\\Tesseract-OCR\\tesseract.exe",
-        r"C:\\Program Files (x86)\\Tesseract-OCR\\tesseract.exe",
-        os.path.join(os.path.expanduser("~"), "AppData", "Local", "Programs", "Tesseract-OCR", "tesseract.exe"),
-    ]
-    for c in candidates:
-        if c and os.path.isfile(c):
-            return c
-    return ""
-
-
-def guess_poppler_bin() -> str:
-    env = os.environ.get("POPPLER_BIN", "")
-    if env and os.path.isdir(env):
-        return env
-    base_candidates = [r"C:\\Tools", r"C:\\Program Files"]
-    for base in base_candidates:
-        if not os.path.isdir(base):
-            continue
+
+def _write_csv_rows(fh, rows: "queue.Queue", errors: List[BaseException]) -> None:
+    """Real-time CSV writer thread: one row per queue item until a None sentinel."""
+    writer = csv.writer(fh)
+    done = False
+    while not done:
+        batch = [rows.get()]
+        # Rows that queued up meanwhile go out with one writerows() and one flush
+        while True:
+            try:
+                batch.append(rows.get_nowait())
+            except queue.Empty:
+                break
+        if None in batch:
+            done = True
+            batch = batch[:batch.index(None)]
+        if errors or not batch:
+            continue  # keep draining after a failure, report once at the end
         try:
-            for name in os.listdir(base):
-                if name.lower().startswith("poppler"):
-                    bin_path = os.path.join(base, name, "Library", "bin")
-                    if os.path.isdir(bin_path):
-                        return bin_path
-                    bin_path2 = os.path.join(base, name, "bin")
-                    if os.path.isdir(bin_path2):
-                        return bin_path2
-        except Exception:
-            pass
-    return ""
-
-
-def validate_paths(in_folder: str, out_file: str) -> Optional[str]:
-    if not in_folder:
-        return "Please select an input folder."
-    if not Path(in_folder).exists():
-        return "Input folder does not exist."
-    if not out_file:
-        return "Please select an output file (CSV or XLSX)."
-    out_dir = Path(out_file).parent
-    if not out_dir.exists():
-        return "Output directory does not exist."
-    if not (out_file.lower().endswith(".csv") or out_file.lower().endswith(".xlsx")):
-        return "Output file must be .csv or .xlsx"
-    return None
-
-
-def export_results(results: List[ExtractionResult], out_file: str) -> None:
-    rows = [
-        {
-            "File Name": r.file_name,
-            "License ID": r.license_id or "",
-            "Date": r.date or "",
-            "Reference ID": r.reference_id or "",
-            "Notes": r.notes or "",
-        }
-        for r in results
-    ]
-    df = pd.DataFrame(rows, columns=["File Name", "License ID", "Date", "Reference ID", "Notes"])
-
-    if out_file.lower().endswith(".csv"):
-        df.to_csv(out_file, index=False, encoding="utf-8")
-    else:
-        with pd.ExcelWriter(out_file, engine="openpyxl") as writer:  # type: ignore
-            df.to_excel(writer, index=False, sheet_name="Results")
+            writer.writerows(batch)
+            fh.flush()
+        except Exception as exc:
+            errors.append(exc)
+
+
+def ocr_pdf_plain_text(pdf_path: Path, tesseract_cmd: Optional[str], poppler_path: Optional[str]) -> str:
+    """
+    OCR every page of a PDF (or take its embedded text) and return the text joined by newlines.
+    Same page pipeline as the main app; top-level so it can be submitted to a worker process.
+    """
+    return "\n".join(t for _, _, t in iter_page_texts(pdf_path, tesseract_cmd, poppler_path, stream=False))
 
 
 class App(tk.Tk):
@@ -120,7 +116,20 @@ class App(tk.Tk):
         self.date_context = ""
         self.ref_context = ""
 
+        # Log lines waiting to be written to the widget in one insert
+        self._log_pending: List[str] = []
+        self._log_scheduled = False
+
+        # (pdf path, mtime, dpi, tesseract) -> first-page OCR text shown by the preview
+        self._preview_cache: Dict[tuple, str] = {}
+
+        # Batch runs on a worker thread; widget updates come back through this queue
+        self._ui_events: "queue.Queue[Callable[[], None]]" = queue.Queue()
+        self._cancel_event = threading.Event()
+        self._is_running = False
+
         self._build_widgets()
+        self.after(UI_POLL_MS, self._drain_ui_events)
 
     def _build_widgets(self) -> None:
         pad = {"padx": 6, "pady": 4}
@@ -173,10 +182,16 @@ class App(tk.Tk):
         self.adv_frame.grid_remove()
 
         # Controls
-        tk.Button(self, text="Preview First PDF", command=self._preview).grid(row=7, column=0, sticky="w", **pad)
-        tk.Button(self, text="Test Run (First PDF)", command=lambda: self._run(run_all=False)).grid(row=7, column=1, sticky="e", **pad)
-        tk.Button(self, text="Run All", command=lambda: self._run(run_all=True), bg="#0078D4", fg="white").grid(row=7, column=2, sticky="w", **pad)
+        btn_preview = tk.Button(self, text="Preview First PDF", command=self._preview)
+        btn_preview.grid(row=7, column=0, sticky="w", **pad)
+        btn_test = tk.Button(self, text="Test Run (First PDF)", command=lambda: self._run(run_all=False))
+        btn_test.grid(row=7, column=1, sticky="e", **pad)
+        btn_run = tk.Button(self, text="Run All", command=lambda: self._run(run_all=True), bg="#0078D4", fg="white")
+        btn_run.grid(row=7, column=2, sticky="w", **pad)
+        self._run_buttons = (btn_preview, btn_test, btn_run)
         tk.Button(self, text="Exit", command=self.destroy).grid(row=7, column=3, sticky="w", **pad)
+        self.btn_cancel = tk.Button(self, text="Cancel", command=self._cancel_run, state="disabled")
+        self.btn_cancel.grid(row=8, column=3, sticky="w", **pad)
 
         # Progress
         self.status_var = tk.StringVar(value="Idle")
@@ -197,9 +212,36 @@ class App(tk.Tk):
         self.grid_rowconfigure(10, weight=1)
         self.grid_columnconfigure(1, weight=1)
 
+    def _post(self, callback: Callable[[], None]) -> None:
+        self._ui_events.put(callback)
+
+    def _drain_ui_events(self) -> None:
+        try:
+            while True:
+                callback = self._ui_events.get_nowait()
+                try:
+                    callback()
+                except Exception:
+                    self.report_callback_exception(*sys.exc_info())
+        except queue.Empty:
+            pass
+        self.after(UI_POLL_MS, self._drain_ui_events)
+
     def _append_log(self, message: str) -> None:
+        self._log_pending.append(message)
+        if not self._log_scheduled:
+            self._log_scheduled = True
+            self.after(LOG_FLUSH_MS, self._flush_log)
+
+    def _flush_log(self) -> None:
+        self._log_scheduled = False
+        if not self._log_pending:
+            return
+        batch = "\n".join(self._log_pending) + "\n"
+        self._log_pending.clear()
         self.log.configure(state="normal")
-        self.log.insert("end", message + "\n")
+        self.log.insert("end", batch)
+        self.log.delete("1.0", f"end-{LOG_MAX_LINES}l")
         self.log.see("end")
         self.log.configure(state="disabled")
 
@@ -223,7 +265,22 @@ class App(tk.Tk):
         if path:
             self.poppler_var.set(path)
 
+    def _set_running(self, is_running: bool) -> None:
+        state = "disabled" if is_running else "normal"
+        for btn in self._run_buttons:
+            btn.configure(state=state)
+        self.btn_cancel.configure(state="normal" if is_running else "disabled")
+        self._is_running = is_running
+
+    def _cancel_run(self) -> None:
+        if self._is_running:
+            self._cancel_event.set()
+            self.btn_cancel.configure(state="disabled")
+            self.status_var.set("Cancelling after the current PDF(s) ...")
+
     def _run(self, run_all: bool = True) -> None:
+        if self._is_running:
+            return
         in_folder = self.in_folder_var.get().strip()
         out_file = self.out_file_var.get().strip()
         tesseract_path = self.tess_path_var.get().strip() or None
@@ -234,6 +291,7 @@ class App(tk.Tk):
             messagebox.showerror("Error", err)
             return
 
+        self._log_pending.clear()
         self.log.configure(state="normal")
         self.log.delete("1.0", "end")
         self.log.configure(state="disabled")
@@ -263,68 +321,177 @@ class App(tk.Tk):
             }
             field_types = None
 
-        results: List[ExtractionResult] = []
         for i in self.table.get_children():
             self.table.delete(i)
-        self.progress.configure(maximum=len(pdfs))
-        
-        # Real-time CSV updates
-        csv_file = out_file if out_file.lower().endswith('.csv') else out_file.replace('.xlsx', '.csv')
-        
-        for idx, pdf_path in enumerate(pdfs, start=1):
-            percentage = int((idx-1) * 100 / len(pdfs))
-            self.status_var.set(f"Processing {pdf_path.name} ({idx}/{len(pdfs)}) - {percentage}%")
-            self._append_log(f"[{idx}/{len(pdfs)}] Processing {pdf_path.name} ...")
-            self.update_idletasks()
-            
-            if self.extraction_method.get() == "t5":
-                # Use T5 extraction
-                res = self._process_pdf_with_t5(
-                    pdf_path,
-                    tesseract_cmd=tesseract_path,
-                    poppler_path=poppler_path,
-                    field_types=field_types,
-                )
-            else:
-                # Use regex extraction
-                res = process_pdf_file(
-                    pdf_path,
-                    tesseract_cmd=tesseract_path,
-                    poppler_path=poppler_path,
-                    log=lambda m: self._append_log(m),
-                    patterns=patterns,
-                )
-            results.append(res)
-            
-            # Update progress
-            self.progress['value'] = idx
-            percentage = int(idx * 100 / len(pdfs))
-            self.status_var.set(f"Completed {pdf_path.name} ({idx}/{len(pdfs)}) - {percentage}%")
-            
-            # Add to results table
-            self.table.insert("", "end", values=(res.file_name, res.license_id or "", res.date or "", res.reference_id or "", res.notes or ""))
-            
-            # Real-time CSV update
-            try:
-                export_results(results, csv_file)
-                self._append_log(f"Updated CSV: {csv_file}")
-            except Exception as exc:
-                self._append_log(f"CSV update failed: {exc}")
-            
-            self._append_log(f"Completed: {pdf_path.name}")
-            self.update_idletasks()
+        self.progress.configure(maximum=len(pdfs), value=0)
+
+        # Widgets are read above; the batch itself runs off the Tk thread
+        self._cancel_event.clear()
+        self._set_running(True)
+        threading.Thread(
+            target=self._run_batch,
+            args=(pdfs, out_file, tesseract_path, poppler_path, patterns, field_types),
+            daemon=True,
+        ).start()
+
+    def _run_batch(
+        self,
+        pdfs: List[Path],
+        out_file: str,
+        tesseract_path: Optional[str],
+        poppler_path: Optional[str],
+        patterns: Optional[Dict[str, List[str]]],
+        field_types: Optional[List[str]],
+    ) -> None:
+        """
+        Worker thread: OCR/extract every PDF and export the results. Widgets are only
+        touched through _post.
+        """
+        try:
+            self._process_batch(pdfs, out_file, tesseract_path, poppler_path, patterns, field_types)
+        except Exception as exc:  # noqa: BLE001
+            self._post(lambda e=exc: messagebox.showerror("Error", f"Processing failed: {e}"))
+            self._post(lambda: self.status_var.set("Failed"))
+        finally:
+            self._post(lambda: self._set_running(False))
+
+    def _process_batch(
+        self,
+        pdfs: List[Path],
+        out_file: str,
+        tesseract_path: Optional[str],
+        poppler_path: Optional[str],
+        patterns: Optional[Dict[str, List[str]]],
+        field_types: Optional[List[str]],
+    ) -> None:
+        log = lambda msg: self._post(lambda m=msg: self._append_log(m))
+
+        # Real-time CSV: opened once, one row appended per completed PDF
+        out_fmt = output_format(out_file)
+        csv_file = out_file if out_fmt == "csv" else os.path.splitext(out_file)[0] + ".csv"
+        csv_fh = None
+        csv_q: "queue.Queue" = queue.Queue()
+        csv_errors: List[BaseException] = []
+        csv_thread: Optional[threading.Thread] = None
+        try:
+            csv_fh = open(csv_file, "w", newline="", encoding="utf-8")
+            csv.writer(csv_fh).writerow(EXPORT_COLUMNS)
+            # Rows are written and flushed on their own thread so disk latency overlaps OCR
+            csv_thread = threading.Thread(target=_write_csv_rows, args=(csv_fh, csv_q, csv_errors), daemon=True)
+            csv_thread.start()
+        except Exception as exc:
+            log(f"CSV update failed: {exc}")
+
+        use_t5 = field_types is not None
+        total = len(pdfs)
+        # Export rows are flattened once, when each result arrives
+        rows_by_index: Dict[int, Tuple[str, ...]] = {}
+        cancelled = False
 
+        # One PDF per worker process; T5 extraction stays here so the model loads once
+        try:
+            workers = default_worker_count(total)
+            with make_process_pool(total, max_workers=workers) as pool:
+                if use_t5:
+                    task = ocr_pdf_plain_text
+                    jobs = (((idx, p), (p, tesseract_path, poppler_path)) for idx, p in enumerate(pdfs, start=1))
+                else:
+                    task = process_pdf_file
+                    jobs = (((idx, p), (p, tesseract_path, poppler_path, None, patterns)) for idx, p in enumerate(pdfs, start=1))
+                log(f"Processing {total} PDF(s) with {workers} worker(s) ...")
+                self._post(lambda: self.status_var.set(f"Processing {total} PDF(s) - 0%"))
+
+                def _emit(idx: int, res: ExtractionResult) -> None:
+                    row = _result_row(res)
+                    rows_by_index[idx] = row
+
+                    # Add to results table
+                    self._post(lambda r=row: self.table.insert("", "end", values=r))
+
+                    # Real-time CSV update
+                    if csv_thread is not None:
+                        csv_q.put(row)
+
+                # OCR'd texts waiting for one batched T5 pass
+                pending: List[tuple] = []
+
+                def _flush_t5() -> None:
+                    if not pending:
+                        return
+                    log(f"Running T5 extraction on {len(pending)} document(s)")
+                    for (idx, pdf_path, _), res in zip(pending, self._extract_with_t5_batch(pending, field_types)):
+                        _emit(idx, res)
+                    pending.clear()
+
+                def _progress(done: int, name: str) -> None:
+                    self.progress["value"] = done
+                    percentage = int(done * 100 / total)
+                    self.status_var.set(f"Completed {name} ({done}/{total}) - {percentage}%")
+                    self._append_log(f"[{done}/{total}] Completed: {name}")
+
+                # A couple of PDFs queued per worker keeps every core busy without
+                # submitting (and pickling) the whole folder up front
+                completed = iter_completed(pool, task, jobs, max_pending=2 * workers)
+                for done, ((idx, pdf_path), fut) in enumerate(completed, start=1):
+                    try:
+                        out = fut.result()
+                    except Exception as exc:
+                        _emit(idx, ExtractionResult(
+                            file_name=pdf_path.name,
+                            license_id=None,
+                            date=None,
+                            reference_id=None,
+                            notes=f"Error: {exc}",
+                        ))
+                    else:
+                        if use_t5:
+                            pending.append((idx, pdf_path, out))
+                            if len(pending) >= T5_BATCH_SIZE:
+                                _flush_t5()
+                        else:
+                            _emit(idx, out)
+
+                    self._post(lambda d=done, n=pdf_path.name: _progress(d, n))
+
+                    if self._cancel_event.is_set():
+                        # Unsubmitted PDFs are dropped; ones already in a worker finish on pool exit
+                        cancelled = True
+                        completed.close()
+                        pool.shutdown(wait=False, cancel_futures=True)
+                        break
+                _flush_t5()
+        finally:
+            if csv_thread is not None:
+                csv_q.put(None)
+                csv_thread.join()
+            if csv_fh is not None:
+                csv_fh.close()
+            if csv_errors:
+                log(f"CSV update failed: {csv_errors[0]}")
+
+        # Final export keeps the folder order regardless of completion order
+        order = sorted(rows_by_index)
+        rows = [rows_by_index[i] for i in order]
+
+        # The real-time CSV already is the CSV output when rows finished in folder order
+        csv_complete = out_fmt == "csv" and csv_thread is not None and not csv_errors
         try:
-            export_results(results, out_file)
-            self._append_log(f"Saved results to {out_file}")
-            messagebox.showinfo("Done", "Extraction completed successfully.")
-            self.status_var.set("Done")
+            if not (csv_complete and list(rows_by_index) == order):
+                export_results(rows, out_file, out_fmt)
         except Exception as exc:  # noqa: BLE001
-            messagebox.showerror("Save Failed", f"Failed to save results: {exc}")
+            self._post(lambda e=exc: messagebox.showerror("Save Failed", f"Failed to save results: {e}"))
+            return
+        log(f"Saved results to {out_file}")
+        if cancelled:
+            log(f"Cancelled after {len(rows)} of {total} PDF(s).")
+            self._post(lambda: self.status_var.set(f"Cancelled ({len(rows)}/{total})"))
+        else:
+            self._post(lambda: messagebox.showinfo("Done", "Extraction completed successfully."))
+            self._post(lambda: self.status_var.set("Done"))
 
     def _preview(self) -> None:
         in_folder = self.in_folder_var.get().strip()
-        if not in_folder or not Path(in_folder).exists():
+        if not in_folder or not os.path.isdir(in_folder):
             messagebox.showerror("Error", "Please select a valid input folder first.")
             return
         pdfs = collect_pdfs_in_folder(in_folder)
@@ -334,16 +501,21 @@ class App(tk.Tk):
         tesseract_path = self.tess_path_var.get().strip() or None
         poppler_path = self.poppler_var.get().strip() or None
 
-        # Preview first page OCR text for first PDF
-        from pdf2image import convert_from_path
-        from ocr_utils import preprocess_image, ocr_image_to_text
+        # Preview first page OCR text for first PDF; 150 DPI is plenty for picking a sample
         try:
-            pages = convert_from_path(str(pdfs[0]), dpi=300, poppler_path=poppler_path)
-            if not pages:
-                messagebox.showerror("Preview", "Failed to render PDF first page.")
-                return
-            pre = preprocess_image(pages[0])
-            txt = ocr_image_to_text(pre, tesseract_cmd=tesseract_path)
+            # Reopening the preview on an unchanged file reuses the earlier OCR text
+            key = (str(pdfs[0]), pdfs[0].stat().st_mtime, PREVIEW_DPI, tesseract_path)
+            txt = self._preview_cache.get(key)
+            if txt is None:
+                page = next(iter_pdf_pages(pdfs[0], dpi=PREVIEW_DPI, poppler_path=poppler_path, grayscale=True, page_numbers=[1]), None)
+                if page is None:
+                    messagebox.showerror("Preview", "Failed to render PDF first page.")
+                    return
+                pre = preprocess_image(page)
+                txt = ocr_image_to_text(pre, tesseract_cmd=tesseract_path)
+                if len(self._preview_cache) >= PREVIEW_CACHE_SIZE:
+                    self._preview_cache.pop(next(iter(self._preview_cache)))
+                self._preview_cache[key] = txt
             # Show top of text in a simple dialog
             snippet = txt.strip()
             if len(snippet) > 2000:
@@ -390,41 +562,7 @@ class App(tk.Tk):
                     self.ref_context = context_text
                 
                 # Show the generated smart patterns
-                def _generate_smart_patterns(sample_text: str, context: str) -> List[str]:
-                    if not sample_text:
-                        return []
-                    
-                    patterns = []
-                    patterns.append(re.escape(sample_text))
-                    
-                    if re.match(r'\d{1,2}[/-]\d{1,2}[/-]\d{4}', sample_text):
-                        patterns.extend([
-                            r'\d{1,2}[/-]\d{1,2}[/-]\d{4}',
-                            r'\d{4}[/-]\d{1,2}[/-]\d{1,2}',
-                            r'\d{1,2}\s+\d{1,2}\s+\d{4}'
-                        ])
-                    elif re.match(r'[A-Z]{2,}\d+', sample_text):
-                        patterns.extend([
-                            r'[A-Z]{2,}\d+',
-                            r'[A-Z]{2,}[-_\s]?\d+',
-                            r'[A-Z]*\d+'
-                        ])
-                    elif re.match(r'\d+', sample_text):
-                        patterns.extend([
-                            r'\d+',
-                            r'[A-Z]*\d+',
-                            r'\d+[A-Z]*'
-                        ])
-                    
-                    if context:
-                        context_words = context.split()
-                        for word in context_words[:3]:
-                            if len(word) > 2:
-                                patterns.append(f'\\b{re.escape(word)}.*?{re.escape(sample_text)}')
-                    
-                    return list(set(patterns))
-                
-                patterns = _generate_smart_patterns(s, context_text)
+                patterns = generate_smart_patterns(s, context_text)
                 pattern_text = "\n".join([f"• {p}" for p in patterns[:5]])  # Show first 5 patterns
                 
                 messagebox.showinfo("Saved", f"Captured {target} sample:\n{s}\n\nContext: {context_text[:100]}...\n\nSmart patterns generated:\n{pattern_text}")
@@ -442,32 +580,32 @@ class App(tk.Tk):
         else:
             self.adv_frame.grid_remove()
     
-    def _process_pdf_with_t5(self, pdf_path: Path, tesseract_cmd: Optional[str], poppler_path: Optional[str], field_types: List[str]) -> ExtractionResult:
+    def _extract_with_t5_batch(self, pending: List[tuple], field_types: List[str]) -> List[ExtractionResult]:
         """
-        Process PDF using T5 model for extraction.
+        Run T5 extraction on (index, pdf_path, text) items already OCR'd by worker processes.
         """
-        from pdf2image import convert_from_path
-        from ocr_utils import preprocess_image, ocr_image_to_text
-        
-        file_name = pdf_path.name
+        # Imported here, not at the top: spawned OCR workers re-run this module's imports
+        # and must not each load TensorFlow
+        from t5_extractor import extract_with_context_t5_batch
+
         try:
-            self._append_log(f"Converting PDF to images: {file_name}")
-            pil_pages = convert_from_path(pdf_path, dpi=300, poppler_path=poppler_path)
-            
-            all_text_parts = []
-            for idx, pil_img in enumerate(pil_pages, start=1):
-                self._append_log(f"Preprocessing page {idx} of {file_name}")
-                pre = preprocess_image(pil_img)
-                self._append_log(f"Running OCR on page {idx} of {file_name}")
-                txt = ocr_image_to_text(pre, tesseract_cmd=tesseract_cmd)
-                all_text_parts.append(txt)
-            
-            full_text = "\n".join(all_text_parts)
-            self._append_log(f"Running T5 extraction on {file_name}")
-            
-            # Use T5 model for extraction
-            extracted_fields = extract_with_context_t5(full_text, field_types, "tf_model.h5")
-            
+            extracted = extract_with_context_t5_batch(
+                [text for _, _, text in pending], field_types, "tf_model.h5", batch_size=T5_BATCH_SIZE
+            )
+        except Exception as exc:
+            return [
+                ExtractionResult(
+                    file_name=pdf_path.name,
+                    license_id=None,
+                    date=None,
+                    reference_id=None,
+                    notes=f"Error: {exc}",
+                )
+                for _, pdf_path, _ in pending
+            ]
+
+        results = []
+        for (_, pdf_path, _), extracted_fields in zip(pending, extracted):
             license_id = extracted_fields.get("license_id")
             date = extracted_fields.get("date")
             reference_id = extracted_fields.get("reference_id")
@@ -476,21 +614,14 @@ class App(tk.Tk):
             if not any([license_id, date, reference_id]):
                 notes = "No fields extracted by T5 model"
             
-            return ExtractionResult(
-                file_name=file_name,
+            results.append(ExtractionResult(
+                file_name=pdf_path.name,
                 license_id=license_id,
                 date=date,
                 reference_id=reference_id,
                 notes=notes,
-            )
-        except Exception as exc:
-            return ExtractionResult(
-                file_name=file_name,
-                license_id=None,
-                date=None,
-                reference_id=None,
-                notes=f"Error: {exc}",
-            )
+            ))
+        return results
 
 
 def main() -> None:
@@ -499,6 +630,8 @@ def main() -> None:
 
 
 if __name__ == "__main__":
+    # Required for the OCR process pool in a frozen (PyInstaller) Windows build
+    multiprocessing.freeze_support()
     main()
 
 
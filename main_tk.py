@@ -1,4 +1,8 @@
+import multiprocessing
+
 from gui.app import main
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    # Required for the OCR process pool in a frozen (PyInstaller) Windows build
+    multiprocessing.freeze_support()
+    main()
@@ -1,53 +1,78 @@
 from .models import ExtractionResult
-from .pdf import convert_pdf_to_images, collect_pdfs_in_folder
+from .pdf import (
+    convert_pdf_to_images,
+    iter_pdf_pages,
+    pdf_page_count,
+    collect_pdfs_in_folder,
+    sort_for_disk_locality,
+)
 from .preprocess import preprocess_image
-from .ocr_engine import ocr_image_to_text
+from .ocr_engine import ocr_image_to_text, ocr_images_to_texts
 from .patterns import DEFAULT_PATTERNS
 from .extract import (
     extract_fields,
     compile_patterns,
     extract_first_match,
+    make_first_match,
     extract_address_between_markers,
     extract_date_range,
 )
-from .pipeline import process_pdf_file, ocr_pdf_to_text
+from .pipeline import process_pdf_file, ocr_pdf_to_text, iter_page_texts
+from .text_layer import read_text_layer
 from .postprocess import postprocess_results
 from .csv_utils import append_rows_csv
+from .store import OCRStore
+from .parallel import make_process_pool, default_worker_count, iter_completed
 from .dynamic import (
     generate_smart_patterns,
     extract_dynamic_fields,
+    compile_field_patterns,
     generate_window_patterns,
     infer_token_shape,
     normalize_text_for_license,
     extract_all_license_numbers,
     bulk_extract,
     bulk_extract_licenses,
+    make_extract_pool,
 )
 
 __all__ = [
     "ExtractionResult",
     "convert_pdf_to_images",
+    "iter_pdf_pages",
+    "pdf_page_count",
     "collect_pdfs_in_folder",
+    "sort_for_disk_locality",
     "preprocess_image",
     "ocr_image_to_text",
+    "ocr_images_to_texts",
     "DEFAULT_PATTERNS",
     "extract_fields",
     "compile_patterns",
     "extract_first_match",
+    "make_first_match",
     "extract_address_between_markers",
     "extract_date_range",
     "process_pdf_file",
     "ocr_pdf_to_text",
+    "iter_page_texts",
+    "read_text_layer",
     "postprocess_results",
     "append_rows_csv",
+    "OCRStore",
+    "make_process_pool",
+    "default_worker_count",
+    "iter_completed",
     "generate_smart_patterns",
     "extract_dynamic_fields",
+    "compile_field_patterns",
     "generate_window_patterns",
     "infer_token_shape",
     "normalize_text_for_license",
     "extract_all_license_numbers",
     "bulk_extract",
     "bulk_extract_licenses",
+    "make_extract_pool",
 ]
 
 
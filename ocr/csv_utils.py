@@ -2,17 +2,20 @@ from __future__ import annotations
 
 import csv
 import os
-from typing import Dict, List
+from typing import Dict, Iterable, List
 
 
-def append_rows_csv(rows: List[Dict[str, str]], out_file: str, columns: List[str]) -> None:
+# Rows are collected in a 1 MiB buffer and reach the file in a few large writes
+_WRITE_BUFFER_SIZE = 1 << 20
+
+
+def append_rows_csv(rows: Iterable[Dict[str, str]], out_file: str, columns: List[str]) -> None:
     file_exists = os.path.exists(out_file)
-    with open(out_file, mode="a", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=columns)
+    with open(out_file, mode="a", newline="", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as f:
+        # Plain csv.writer over value lists: no per-row dict rebuild or extra-key check
+        writer = csv.writer(f)
         if not file_exists:
-            writer.writeheader()
-        for row in rows:
-            clean = {col: row.get(col, "") for col in columns}
-            writer.writerow(clean)
+            writer.writerow(columns)
+        writer.writerows([row.get(col, "") for col in columns] for row in rows)
 
 
@@ -1,30 +1,57 @@
 from __future__ import annotations
 
+import functools
+import itertools
 import re
-from typing import Dict, List, Optional
+import sys
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, TypeVar
+
+from .extract import RE2_AVAILABLE, _compile_linear, make_fields_first_match, _text_digest
+from .parallel import default_worker_count, make_process_pool
+
+# Shape detectors used to pick generic suggestions for a selected sample
+_DATE_RE = re.compile(r"\d{1,2}[/-]\d{1,2}[/-]\d{4}")
+_ALPHA_NUM_RE = re.compile(r"[A-Z]{2,}\d+")
+_NUM_RE = re.compile(r"\d+")
+
+# Each word in a window gap is a maximal \W run then a maximal \w run, so making
+# both possessive (Python 3.11+) changes no match but stops re retrying every split of
+# them when a long line fails to match. RE2 has no backtracking to stop and rejects
+# the syntax, so the plain form is kept when it is installed.
+_POSSESSIVE = "++" if sys.version_info >= (3, 11) and not RE2_AVAILABLE else "+"
+
+# Pattern suggestions are memoized: users re-select the same samples while refining fields
+PATTERN_CACHE_SIZE = 512
 
 
 def generate_smart_patterns(sample_text: str, context_text: str | None = None) -> List[str]:
+    # A fresh list each call so callers can slice/extend without touching the cache
+    return list(_smart_patterns(sample_text, context_text))
+
+
+@functools.lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def _smart_patterns(sample_text: str, context_text: Optional[str]) -> Tuple[str, ...]:
     if not sample_text:
-        return []
+        return ()
 
     patterns: List[str] = []
     patterns.append(re.escape(sample_text))
 
     try:
-        if re.match(r"\d{1,2}[/-]\d{1,2}[/-]\d{4}", sample_text):
+        if _DATE_RE.match(sample_text):
             patterns.extend([
                 r"\d{1,2}[/-]\d{1,2}[/-]\d{4}",
                 r"\d{4}[/-]\d{1,2}[/-]\d{1,2}",
                 r"\d{1,2}\s+\d{1,2}\s+\d{4}",
             ])
-        elif re.match(r"[A-Z]{2,}\d+", sample_text):
+        elif _ALPHA_NUM_RE.match(sample_text):
             patterns.extend([
                 r"[A-Z]{2,}\d+",
                 r"[A-Z]{2,}[-_\s]?\d+",
                 r"[A-Z]*\d+",
             ])
-        elif re.match(r"\d+", sample_text):
+        elif _NUM_RE.match(sample_text):
             patterns.extend([
                 r"\d+",
                 r"[A-Z]*\d+",
@@ -42,41 +69,71 @@ def generate_smart_patterns(sample_text: str, context_text: str | None = None) -
         except Exception:
             pass
 
-    seen: set[str] = set()
-    deduped: List[str] = []
-    for p in patterns:
-        if p not in seen:
-            seen.add(p)
-            deduped.append(p)
-    return deduped
+    return tuple(dict.fromkeys(patterns))
 
 
-def extract_dynamic_fields(text: str, field_to_patterns: Dict[str, List[str]]) -> Dict[str, str]:
-    out: Dict[str, str] = {}
+def compile_field_patterns(field_to_patterns: Dict[str, List[str]]) -> Dict[str, List[re.Pattern[str]]]:
+    """Compile each distinct pattern once, even when fields share it; invalid user patterns are skipped."""
+    compiled: Dict[str, List[re.Pattern[str]]] = {}
+    cache: Dict[str, Optional[re.Pattern[str]]] = {}
     for field_name, patterns in field_to_patterns.items():
-        value: Optional[str] = None
+        regs: List[re.Pattern[str]] = []
         for raw in patterns:
-            try:
-                rgx = re.compile(raw, flags=re.IGNORECASE)
-                m = rgx.search(text)
-                if m:
-                    value = m.group(1) if m.lastindex else m.group(0)
-                    break
-            except Exception:
-                continue
-        out[field_name] = value or ""
-    return out
+            if raw not in cache:
+                try:
+                    cache[raw] = re.compile(raw, flags=re.IGNORECASE)
+                except Exception:
+                    cache[raw] = None
+            if cache[raw] is not None:
+                regs.append(cache[raw])
+        compiled[field_name] = regs
+    return compiled
+
+
+_Fields = Tuple[Tuple[str, Tuple[str, ...]], ...]
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_searcher(fields: _Fields) -> Callable[[str], Dict[str, Optional[str]]]:
+    # Combined scans keeping "first pattern in the list wins" per field; one pass for
+    # all fields on RE2
+    return make_fields_first_match(compile_field_patterns({name: list(patterns) for name, patterns in fields}))
+
+
+def _freeze_fields(field_to_patterns: Dict[str, List[str]]) -> _Fields:
+    return tuple((name, tuple(patterns)) for name, patterns in field_to_patterns.items())
+
+
+def _extract_frozen(fields: _Fields, text: str) -> Dict[str, str]:
+    # Top-level so bulk_extract can hand it to worker processes, which compile on first use
+    return {name: value or "" for name, value in _cached_searcher(fields)(text).items()}
+
+
+def extract_dynamic_fields(text: str, field_to_patterns: Dict[str, List[str]]) -> Dict[str, str]:
+    # Called once per document with the same fields; compile them on the first call only
+    return _extract_frozen(_freeze_fields(field_to_patterns), text)
 
 
 def generate_window_patterns(
     sample_text: str,
-    before_words: List[str],
-    after_words: List[str],
+    before_words: Sequence[str],
+    after_words: Sequence[str],
     max_words_window: int = 3,
     shape_regex: Optional[str] = None,
 ) -> List[str]:
+    return list(_window_patterns(sample_text, tuple(before_words), tuple(after_words), max_words_window, shape_regex))
+
+
+@functools.lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def _window_patterns(
+    sample_text: str,
+    before_words: Tuple[str, ...],
+    after_words: Tuple[str, ...],
+    max_words_window: int,
+    shape_regex: Optional[str],
+) -> Tuple[str, ...]:
     if not sample_text:
-        return []
+        return ()
     if shape_regex is None:
         shape_regex = infer_token_shape(sample_text)
     join_words = lambda ws: [re.escape(w) for w in ws if len(w) > 1]
@@ -84,22 +141,17 @@ def generate_window_patterns(
     aw = join_words(after_words)[:max_words_window]
 
     patterns: List[str] = []
-    gap = rf"(?:\W+\w+){{0,{max_words_window}}}"
+    gap = rf"(?:\W{_POSSESSIVE}\w{_POSSESSIVE}){{0,{max_words_window}}}"
 
     for w in bw:
         patterns.append(rf"\b{w}\b{gap}\W+({shape_regex})")
     for w in aw:
         patterns.append(rf"({shape_regex})\W+{gap}\b{w}\b")
 
-    seen: set[str] = set()
-    out: List[str] = []
-    for p in patterns:
-        if p not in seen:
-            seen.add(p)
-            out.append(p)
-    return out
+    return tuple(dict.fromkeys(patterns))
 
 
+@functools.lru_cache(maxsize=PATTERN_CACHE_SIZE)
 def infer_token_shape(sample_text: str) -> str:
     s = sample_text.strip()
     if not s:
@@ -119,74 +171,138 @@ def infer_token_shape(sample_text: str) -> str:
 
 LICENSE_TYPE_A = (
     r"\b(?:[A-Z]{1,5}|No)\.?\s*\d{1,10}\s*"
-    r"\(\s*[Rr][ \t/_\\\-:;]*[A-Za-z0-9\u2080-\u2089;:/\-]{1,8}\s*\)"
+    # Subscript digits are literal characters (not \u escapes) so RE2 can parse the class too
+    r"\(\s*[Rr][ \t/_\\\-:;]*[A-Za-z0-9" "\u2080-\u2089" r";:/\-]{1,8}\s*\)"
 )
 LICENSE_TYPE_B = r"\b\d{1,6}/\d{1,6}\s*R\d+\b"
+# Scanned over whole OCR'd pages, so ASCII pages run on RE2 (linear time) when it is installed
+_LICENSE_TYPE_A_RE = _compile_linear(LICENSE_TYPE_A, re.IGNORECASE)
+_LICENSE_TYPE_B_RE = _compile_linear(LICENSE_TYPE_B, re.IGNORECASE)
+_LICENSE_CHAR_MAP = str.maketrans({"（": "(", "）": ")", "[": "(", "]": ")", "\u200b": None})
+_BRACKETED_RE = re.compile(r"\(([^)]{1,20})\)")
+_O_BETWEEN_DIGITS_RE = re.compile(r"(?<=\d)O(?=\d)")
 
 
 def normalize_text_for_license(text: str) -> str:
-    t = text
-    t = t.replace("（", "(").replace("）", ")").replace("[", "(").replace("]", ")")
-    t = t.upper()
-    t = re.sub(r"\s+", " ", t)
-    t = t.replace("\u200b", "")
+    t = text.upper()
+    # Collapse whitespace runs in C; the ends are trimmed too, which no match depends on
+    t = " ".join(t.split())
+    # Bracket variants and zero-width spaces in one pass, still after the collapse as before
+    t = t.translate(_LICENSE_CHAR_MAP)
 
     def _fix_brackets(m: re.Match[str]) -> str:
         inner = m.group(1)
-        fixed = re.sub(r"(?<=\d)O(?=\d)", "0", inner)
+        fixed = _O_BETWEEN_DIGITS_RE.sub("0", inner)
         return f"({fixed})"
 
-    t = re.sub(r"\(([^)]{1,20})\)", _fix_brackets, t)
+    t = _BRACKETED_RE.sub(_fix_brackets, t)
     return t
 
 
-def extract_all_license_numbers(text: str) -> List[str]:
-    txt = normalize_text_for_license(text or "")
-    type_a: List[str] = []
-    type_b: List[str] = []
-    seen_a: set[str] = set()
-    seen_b: set[str] = set()
-
-    for m in re.finditer(LICENSE_TYPE_A, txt, flags=re.IGNORECASE):
+def _unique_matches(rgx, txt: str) -> List[str]:
+    # First spelling of each match, compared case-insensitively; setdefault is one lookup
+    found: Dict[str, str] = {}
+    for m in rgx.finditer(txt):
         val = m.group(0).strip()
-        key = val.upper()
-        if key not in seen_a:
-            seen_a.add(key)
-            type_a.append(val)
+        found.setdefault(val.upper(), val)
+    return list(found.values())
 
-    for m in re.finditer(LICENSE_TYPE_B, txt, flags=re.IGNORECASE):
-        val = m.group(0).strip()
-        key = val.upper()
-        if key not in seen_b:
-            seen_b.add(key)
-            type_b.append(val)
 
-    return type_a if type_a else type_b
-
-
-def bulk_extract(rows: List[Dict[str, str]], field_to_patterns: Dict[str, List[str]]) -> List[Dict[str, str]]:
-    results: List[Dict[str, str]] = []
-    for row in rows:
-        text = row.get("Text", "") or ""
-        extracted = extract_dynamic_fields(text, field_to_patterns)
-        out_row: Dict[str, str] = {"File Name": row.get("File Name", "")}
-        out_row.update(extracted)
-        results.append(out_row)
-    return results
-
-
-def bulk_extract_licenses(rows: List[Dict[str, str]]) -> List[Dict[str, str]]:
+def extract_all_license_numbers(text: str) -> List[str]:
+    txt = normalize_text_for_license(text or "")
+    # Type B is only a fallback, so its pass over the text is skipped when type A matched
+    return _unique_matches(_LICENSE_TYPE_A_RE, txt) or _unique_matches(_LICENSE_TYPE_B_RE, txt)
+
+
+# Rows read ahead per round of (possibly pooled) extraction
+EXTRACT_CHUNK_ROWS = 256
+# Batch text (characters) from which make_extract_pool starts a pool. re scans the
+# default fields and license patterns at roughly 10-30 MB/s per core, and spawned workers
+# re-import cv2/numpy/pytesseract for a second or more on Windows, so processes only pay
+# off for large batches. Threads (google-re2) start at once and just need enough work.
+PROCESS_POOL_MIN_CHARS = 16 << 20
+THREAD_POOL_MIN_CHARS = 1 << 20
+
+_R = TypeVar("_R")
+
+
+def make_extract_pool(total_chars: int, workers: Optional[int] = None) -> Optional[Executor]:
+    """
+    Pool for bulk_extract/bulk_extract_licenses over a batch of ``total_chars`` characters
+    of text, or None when the batch is too small for one to pay off. Threads with google-re2,
+    which drops the GIL while it scans, otherwise processes, since re holds the GIL
+    throughout. Share it between the passes over one batch and shut it down afterwards.
+    """
+    workers = workers or default_worker_count(EXTRACT_CHUNK_ROWS)
+    if workers < 2:
+        return None
+    if RE2_AVAILABLE:
+        return ThreadPoolExecutor(max_workers=workers) if total_chars >= THREAD_POOL_MIN_CHARS else None
+    return make_process_pool(workers, max_workers=workers) if total_chars >= PROCESS_POOL_MIN_CHARS else None
+
+
+def _extract_rows(
+    rows: Iterable[Dict[str, str]],
+    text_of: Callable[[Dict[str, str]], str],
+    extract: Callable[[str], _R],
+    pool: Optional[Executor] = None,
+) -> Iterator[Tuple[Dict[str, str], _R]]:
+    """
+    Yield (row, extract(text_of(row))) in row order, running extract once per distinct text.
+
+    With a pool (see make_extract_pool) each chunk's distinct texts are spread over it;
+    otherwise they are extracted inline. extract must be picklable.
+    """
+    seen: Dict[bytes, _R] = {}
+    it = iter(rows)
+    for chunk in iter(lambda: list(itertools.islice(it, EXTRACT_CHUNK_ROWS)), []):
+        texts = [text_of(row) for row in chunk]
+        keys = [_text_digest(text) for text in texts]
+        todo: Dict[bytes, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in seen:
+                todo.setdefault(key, text)
+        if pool is not None and len(todo) > 1:
+            # A few tasks per worker per chunk keeps the pickling overhead down
+            chunksize = max(1, len(todo) // (default_worker_count(len(todo)) * 4))
+            extracted = pool.map(extract, todo.values(), chunksize=chunksize)
+        else:
+            extracted = map(extract, todo.values())
+        seen.update(zip(todo, extracted))
+        for row, key in zip(chunk, keys):
+            yield row, seen[key]
+
+
+def bulk_extract(
+    rows: Iterable[Dict[str, str]],
+    field_to_patterns: Dict[str, List[str]],
+    pool: Optional[Executor] = None,
+) -> List[Dict[str, str]]:
+    # Compile once for the whole batch (and once per worker) rather than once per row
+    extract = functools.partial(_extract_frozen, _freeze_fields(field_to_patterns))
+    return [
+        {"File Name": row.get("File Name", ""), **extracted}
+        for row, extracted in _extract_rows(rows, lambda r: r.get("Text", "") or "", extract, pool)
+    ]
+
+
+def _first_license(first_page_text: str) -> str:
+    # Choose only one license (first match) to meet requirement
+    return "; ".join(extract_all_license_numbers(first_page_text)[:1])
+
+
+def bulk_extract_licenses(rows: Iterable[Dict[str, str]], pool: Optional[Executor] = None) -> List[Dict[str, str]]:
     out: List[Dict[str, str]] = []
-    for r in rows:
+
+    def first_page_of(r: Dict[str, str]) -> str:
         text = r.get("Text", "") or ""
         # Restrict to first page only: split by explicit page separator if present
-        first_page_text = text.split("--- PAGE BREAK ---", 1)[0] if text else ""
-        licenses_all = extract_all_license_numbers(first_page_text)
-        # Choose only one license (first match) to meet requirement
-        licenses = licenses_all[:1]
+        return text.split("--- PAGE BREAK ---", 1)[0] if text else ""
+
+    for r, licenses in _extract_rows(rows, first_page_of, _first_license, pool):
         out.append({
             "File Name": r.get("File Name", ""),
-            "Licenses": "; ".join(licenses),
+            "Licenses": licenses,
         })
     return out
 
@@ -1,14 +1,33 @@
 from __future__ import annotations
 
+import functools
+import hashlib
 import re
-from typing import Dict, Iterable, List, Optional, Tuple
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, TypeVar
 import re
 
+try:
+    import re2  # type: ignore
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+_T = TypeVar("_T")
+
+
+@functools.lru_cache(maxsize=512)
+def _compile_ci(expr: str) -> re.Pattern[str]:
+    # extract_fields runs once per PDF with the same patterns; compile each expression once
+    # per process. Bounded like re's own cache, since users keep editing patterns.
+    return re.compile(expr, flags=re.IGNORECASE)
+
 
 def compile_patterns(patterns: Dict[str, Iterable[str]]) -> Dict[str, List[re.Pattern[str]]]:
     compiled: Dict[str, List[re.Pattern[str]]] = {}
     for key, exprs in patterns.items():
-        compiled[key] = [re.compile(expr, flags=re.IGNORECASE) for expr in exprs]
+        compiled[key] = [_compile_ci(expr) for expr in exprs]
     return compiled
 
 
@@ -22,24 +41,324 @@ def extract_first_match(text: str, regex_list: Iterable[re.Pattern[str]]) -> Opt
     return None
 
 
+# Group-number backreferences and conditionals break once patterns are renumbered inside one regex
+_RENUMBER_UNSAFE = re.compile(r"\\[1-9]|\(\?\(")
+
+
+def make_first_match(regex_list: Iterable[re.Pattern[str]]) -> Callable[[str], Optional[str]]:
+    """
+    Return a function equivalent to ``extract_first_match(text, regex_list)`` that scans
+    the text once with all patterns combined instead of once per pattern.
+
+    Each pattern is wrapped as ``(?=(p))`` and joined by ``|``, so at every position
+    the earliest pattern that matches there is reported. The lowest-priority-index hit
+    over the whole scan is the pattern extract_first_match would pick, and its first
+    hit is that pattern's leftmost match. After each hit the rest of the text is only
+    searched for the patterns that outrank it, so the scan stops as soon as nothing
+    better can match. Falls back to per-pattern search when the patterns cannot be
+    combined safely.
+    """
+    regs = list(regex_list)
+    search = _re_first_match(regs)
+    if RE2_AVAILABLE:
+        linear = _re2_first_match(regs)
+        if linear is not None:
+            return _ascii_or(linear, search)
+    return search
+
+
+def _ascii_or(linear: Callable[[str], _T], fallback: Callable[[str], _T]) -> Callable[[str], _T]:
+    # RE2's \s, \d, \w and \b (and its case folding) only know ASCII. Text with anything
+    # else, e.g. the NBSP of a pypdf text layer, goes to re (see _re2_text_ok).
+    return lambda text: linear(text) if _re2_text_ok(text) else fallback(text)
+
+
+# ASCII whitespace in Python's \s but not RE2's: vertical tab and the \x1c-\x1f separators
+_RE2_MISSING_SPACE = re.compile(r"[\x0b\x1c-\x1f]")
+
+
+def _re2_text_ok(text: str) -> bool:
+    # isascii() is O(1) on CPython; the separator scan only runs on ASCII text
+    return text.isascii() and not _RE2_MISSING_SPACE.search(text)
+
+
+def _re_first_match(regs: List[re.Pattern[str]]) -> Callable[[str], Optional[str]]:
+    if len(regs) < 2:
+        return lambda text: extract_first_match(text, regs)
+
+    flags = regs[0].flags
+    if flags & re.VERBOSE or any(r.flags != flags or _RENUMBER_UNSAFE.search(r.pattern) for r in regs):
+        return lambda text: extract_first_match(text, regs)
+    # wrapper group index -> (priority, number of the pattern's own groups)
+    slots: Dict[int, Tuple[int, int]] = {}
+    parts: List[str] = []
+    group = 1
+    for priority, r in enumerate(regs):
+        slots[group] = (priority, r.groups)
+        parts.append(f"(?=({r.pattern}))")
+        group += 1 + r.groups
+    try:
+        combined = re.compile("|".join(parts), flags=flags)
+    except re.error:
+        return lambda text: extract_first_match(text, regs)
+    # Alternations of the first k patterns only; group numbers match the full one
+    prefixes: Dict[int, re.Pattern[str]] = {len(parts): combined}
+
+    def _prefix(k: int) -> re.Pattern[str]:
+        rgx = prefixes.get(k)
+        if rgx is None:
+            rgx = prefixes[k] = re.compile("|".join(parts[:k]), flags=flags)
+        return rgx
+
+    def _search(text: str) -> Optional[str]:
+        best: Optional[Tuple[int, re.Match[str]]] = None
+        limit, pos = len(parts), 0
+        while True:
+            m = _prefix(limit).search(text, pos)
+            if m is None:
+                break
+            g = m.lastindex
+            best = (g, m)
+            # No pattern ranked above this one matched earlier, so only those are left to try
+            limit = slots[g][0]
+            if limit == 0:
+                break
+            pos = m.start() + 1
+        if best is None:
+            return None
+        g, m = best
+        n_groups = slots[g][1]
+        # Same rule as extract_first_match: group 1 if any of the pattern's groups took part
+        if any(m.start(g + i) != -1 for i in range(1, n_groups + 1)):
+            return m.group(g + 1)
+        return m.group(g)
+
+    return _search
+
+
+# Syntax RE2 rejects: backreferences, lookaround, conditionals, atomic groups and
+# possessive quantifiers. Checked up front because RE2 logs every failed parse to stderr.
+_RE2_UNSUPPORTED = re.compile(r"\\[1-9]|\(\?(?:[=!(>]|<[=!]|P=)|(?<!\\)[*+?}]\+")
+_ESCAPED_CHAR = re.compile(r"\\.", re.DOTALL)
+
+
+def _re2_accepts(pattern: str) -> bool:
+    """
+    True if RE2 parses the pattern the way re does. Besides the syntax RE2 rejects, this
+    leaves out syntax it accepts with another meaning: ``x{,n}`` (literal braces to RE2)
+    and ``$`` (re also matches it before a trailing newline).
+    """
+    if _RE2_UNSUPPORTED.search(pattern):
+        return False
+    unescaped = _ESCAPED_CHAR.sub("", pattern)
+    return "{," not in unescaped and "$" not in unescaped
+
+
+def _compile_linear(pattern: str, flags: int = 0):
+    """
+    google-re2 when it is installed and can take the pattern (for ASCII text), else re.
+    Both compiled forms offer search/finditer/Match.group, so callers need not care which
+    they got.
+    """
+    fallback = re.compile(pattern, flags)
+    if RE2_AVAILABLE and not flags & ~(re.IGNORECASE | re.UNICODE) and _re2_accepts(pattern):
+        try:
+            return _AsciiLinearPattern(re2.compile(("(?i)" if flags & re.IGNORECASE else "") + pattern), fallback)
+        except Exception:
+            pass
+    return fallback
+
+
+class _AsciiLinearPattern:
+    """A google-re2 pattern for ASCII text and its re twin for anything else (see _ascii_or)."""
+
+    def __init__(self, linear, fallback: re.Pattern[str]) -> None:
+        self._linear = linear
+        self._fallback = fallback
+        self.pattern = fallback.pattern
+
+    def _for(self, text: str):
+        return self._linear if _re2_text_ok(text) else self._fallback
+
+    def search(self, text: str, *args):
+        return self._for(text).search(text, *args)
+
+    def finditer(self, text: str, *args):
+        return self._for(text).finditer(text, *args)
+
+
+def _re2_sources(regs: List[re.Pattern[str]]) -> Optional[List[str]]:
+    # Patterns as RE2 source text, or None if any of them needs re
+    sources: List[str] = []
+    for r in regs:
+        if r.flags & ~(re.IGNORECASE | re.UNICODE) or not _re2_accepts(r.pattern):
+            return None
+        sources.append(("(?i)" if r.flags & re.IGNORECASE else "") + r.pattern)
+    return sources
+
+
+def _re2_first_match(regs: List[re.Pattern[str]]) -> Optional[Callable[[str], Optional[str]]]:
+    """
+    First-match search on google-re2, which runs in linear time however the (user-written)
+    patterns are shaped. An RE2 set finds which patterns match anywhere in one pass over
+    the text; only the best of those is then searched again for its groups. Returns None
+    if any pattern uses syntax RE2 lacks (lookaround, backreferences) or flags other than
+    IGNORECASE, so the caller keeps using re.
+    """
+    sources = _re2_sources(regs)
+    if sources is None:
+        return None
+    try:
+        compiled = [re2.compile(src) for src in sources]
+    except Exception:
+        return None
+    if len(compiled) < 2:
+        return lambda text: extract_first_match(text, compiled)
+    try:
+        pattern_set = re2.Set.SearchSet()
+        for src in sources:
+            pattern_set.Add(src)
+        pattern_set.Compile()
+    except Exception:
+        return lambda text: extract_first_match(text, compiled)
+
+    def _search(text: str) -> Optional[str]:
+        # Set ids follow insertion order, so the lowest id is the highest-priority hit
+        hits = pattern_set.Match(text)
+        if not hits:
+            return None
+        return extract_first_match(text, [compiled[min(hits)]])
+
+    return _search
+
+
+def make_fields_first_match(
+    fields: Dict[str, List[re.Pattern[str]]],
+) -> Callable[[str], Dict[str, Optional[str]]]:
+    """
+    make_first_match for several fields at once, returning ``{field: match or None}``.
+    On google-re2 the patterns of all fields go into one set, so a single pass over the
+    text finds every field's best pattern; otherwise each field gets its own combined scan.
+    """
+    if RE2_AVAILABLE and len(fields) > 1:
+        linear = _re2_fields_first_match(fields)
+        if linear is not None:
+            fallback = {name: _re_first_match(list(regs)) for name, regs in fields.items()}
+            return _ascii_or(linear, lambda text: {name: search(text) for name, search in fallback.items()})
+    searchers = {name: make_first_match(regs) for name, regs in fields.items()}
+    return lambda text: {name: search(text) for name, search in searchers.items()}
+
+
+def _re2_fields_first_match(
+    fields: Dict[str, List[re.Pattern[str]]],
+) -> Optional[Callable[[str], Dict[str, Optional[str]]]]:
+    compiled: Dict[str, list] = {}
+    # Set id -> (field, priority within the field)
+    owners: List[Tuple[str, int]] = []
+    try:
+        pattern_set = re2.Set.SearchSet()
+        for name, regs in fields.items():
+            sources = _re2_sources(regs)
+            if sources is None:
+                return None
+            compiled[name] = [re2.compile(src) for src in sources]
+            for priority, src in enumerate(sources):
+                pattern_set.Add(src)
+                owners.append((name, priority))
+        pattern_set.Compile()
+    except Exception:
+        return None
+
+    def _search(text: str) -> Dict[str, Optional[str]]:
+        best: Dict[str, int] = {}
+        for i in pattern_set.Match(text) or ():
+            name, priority = owners[i]
+            if priority < best.get(name, len(owners)):
+                best[name] = priority
+        return {
+            name: extract_first_match(text, [compiled[name][best[name]]]) if name in best else None
+            for name in fields
+        }
+
+    return _search
+
+
+# Bounded like dynamic._cached_searcher: every pattern edit in a session is a new key
+@functools.lru_cache(maxsize=32)
+def _fields_first_match_for(
+    fields: Tuple[Tuple[str, Tuple[str, ...]], ...],
+) -> Callable[[str], Dict[str, Optional[str]]]:
+    return make_fields_first_match({name: [_compile_ci(expr) for expr in exprs] for name, exprs in fields})
+
+
 def extract_fields(
     text: str,
     patterns: Optional[Dict[str, Iterable[str]]] = None,
 ) -> Tuple[Optional[str], Optional[str], Optional[str]]:
     from .patterns import DEFAULT_PATTERNS
 
-    to_use = compile_patterns(patterns or DEFAULT_PATTERNS)
+    to_use = patterns or DEFAULT_PATTERNS
 
-    license_id = extract_first_match(text, to_use.get("license_id", []))
-    date = extract_first_match(text, to_use.get("date", []))
-    reference_id = extract_first_match(text, to_use.get("reference_id", []))
+    keys = ("license_id", "date", "reference_id")
+    found = _fields_first_match_for(tuple((key, tuple(to_use.get(key, []))) for key in keys))(text)
 
-    return license_id, date, reference_id
+    return found["license_id"], found["date"], found["reference_id"]
 
 
 import re
 from typing import Optional
 
+# Whole-document results kept per text digest; enough for a batch's repeated templates
+TEXT_MEMO_SIZE = 256
+
+
+def _text_digest(text: str) -> bytes:
+    # Stands in for a (possibly long) document text as a cache key without keeping it alive
+    return hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+
+def _memoize_by_text(fn: Callable[[str], _T]) -> Callable[[str], _T]:
+    cache: "OrderedDict[bytes, _T]" = OrderedDict()
+    lock = threading.Lock()
+
+    @functools.wraps(fn)
+    def wrapper(text: str) -> _T:
+        if not text:
+            return fn(text)
+        key = _text_digest(text)
+        with lock:
+            if key in cache:
+                cache.move_to_end(key)
+                return cache[key]
+        result = fn(text)
+        with lock:
+            cache[key] = result
+            if len(cache) > TEXT_MEMO_SIZE:
+                cache.popitem(last=False)
+        return result
+
+    return wrapper
+
+
+_ZERO_WIDTH_CR_RE = re.compile(r"[\u200b\r]+")
+_MULTI_SPACE_RE = re.compile(r"\s{2,}")
+_TOWER_ADDRESS_RE = re.compile(
+    r"""
+    (?:Telecommunication|Transmission)[\w\s,()/-]*?          # tower-related phrase
+    \s+at\s+                                                # 'at' introducing address
+    (.*?)                                                   # <-- capture address text
+    (?=                                                     # stop capturing at these keywords
+        \s+of\s+Dialog|
+        \s*situated|
+        \s*within|
+        \s*under|
+        $                                                  # or end of string
+    )
+    """,
+    flags=re.IGNORECASE | re.DOTALL | re.VERBOSE,
+)
+
+@_memoize_by_text
 def extract_address_between_markers(text: str) -> Optional[str]:
     """
     Extract address associated with telecommunication tower references.
@@ -51,28 +370,12 @@ def extract_address_between_markers(text: str) -> Optional[str]:
     if not text:
         return None
 
-    t = re.sub(r"[\u200b\r]+", " ", text)
-
-    pattern = re.compile(
-        r"""
-        (?:Telecommunication|Transmission)[\w\s,()/-]*?          # tower-related phrase
-        \s+at\s+                                                # 'at' introducing address
-        (.*?)                                                   # <-- capture address text
-        (?=                                                     # stop capturing at these keywords
-            \s+of\s+Dialog|
-            \s*situated|
-            \s*within|
-            \s*under|
-            $                                                  # or end of string
-        )
-        """,
-        flags=re.IGNORECASE | re.DOTALL | re.VERBOSE,
-    )
+    t = _ZERO_WIDTH_CR_RE.sub(" ", text)
 
-    match = pattern.search(t)
+    match = _TOWER_ADDRESS_RE.search(t)
     if match:
         addr = match.group(1)
-        addr = re.sub(r"\s{2,}", " ", addr)
+        addr = _MULTI_SPACE_RE.sub(" ", addr)
         addr = addr.strip(" ,.;:-")
         return addr
 
@@ -85,6 +388,58 @@ from typing import Tuple, Optional
 import re
 from typing import Tuple, Optional
 
+# --- Numeric date pattern ---
+_DAY = r"\d{1,2}"
+_MON = r"\d{1,2}"
+_YEAR = r"\d{4}"
+_SEP = r"\s*[\.\-]\s*"
+_NUMERIC_DATE = rf"{_DAY}{_SEP}{_MON}{_SEP}{_YEAR}"
+
+# --- Textual date pattern (ordinal or OCR double-quote) ---
+_DAY_SUFFIX = r'(?:st|nd|rd|th|"|”)?'  # handle OCR quotes or ordinal
+_DAY_TEXT = rf"\d{{1,2}}{_DAY_SUFFIX}"
+_MONTH_TEXT = r"(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec|" \
+              r"January|February|March|April|May|June|July|August|September|October|November|December)"
+_TEXTUAL_DATE = rf"{_DAY_TEXT}\s*{_MONTH_TEXT}\s+{_YEAR}"
+
+# Combine patterns
+_DATE_PAT = rf"(?:{_NUMERIC_DATE}|{_TEXTUAL_DATE})"
+
+# Match "date to date"
+_DATE_RANGE_RE = re.compile(
+    rf"({_DATE_PAT}).{{0,40}}?\bto\b.{{0,40}}?({_DATE_PAT})",
+    re.IGNORECASE | re.DOTALL
+)
+# Ordinal suffix after a day, month name or separator run, rewritten in one scan. Same
+# alternation order as the date pattern, so "January" still only has "Jan" replaced.
+_DATE_PARTS_RE = re.compile(
+    r'(?P<ord>(?<=\d)(?:st|nd|rd|th|"|”))'
+    r'|(?P<mon>Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec|'
+    r'January|February|March|April|May|June|July|August|September|October|November|December)'
+    r'|(?P<sep>[\s\.\-]+)',
+    re.IGNORECASE,
+)
+_MONTH_MAP = {
+    'jan':'1','feb':'2','mar':'3','apr':'4','may':'5','jun':'6',
+    'jul':'7','aug':'8','sep':'9','oct':'10','nov':'11','dec':'12'
+}
+
+
+def _date_part(m: re.Match[str]) -> str:
+    kind = m.lastgroup
+    if kind == "ord":
+        return ""
+    if kind == "mon":
+        return _MONTH_MAP[m.group(0).lower()[:3]]
+    return "."
+
+
+def _normalize_date(s: str) -> str:
+    # Drop ordinal suffixes or OCR quotes, months to numbers, separators/spaces to dots
+    return _DATE_PARTS_RE.sub(_date_part, s)
+
+
+@_memoize_by_text
 def extract_date_range(text: str) -> Tuple[Optional[str], Optional[str]]:
     """
     Extract date ranges from text, handling:
@@ -96,54 +451,12 @@ def extract_date_range(text: str) -> Tuple[Optional[str], Optional[str]]:
     if not text:
         return None, None
 
-    t = re.sub(r"[\u200b\r]+", " ", text)
-
-    # --- Numeric date pattern ---
-    day = r"\d{1,2}"
-    mon = r"\d{1,2}"
-    year = r"\d{4}"
-    sep = r"\s*[\.\-]\s*" 
-    numeric_date = rf"{day}{sep}{mon}{sep}{year}"
-
-    # --- Textual date pattern (ordinal or OCR double-quote) ---
-    day_suffix = r'(?:st|nd|rd|th|"|”)?'  # handle OCR quotes or ordinal
-    day_text = rf"\d{{1,2}}{day_suffix}"
-    month_text = r"(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec|" \
-                 r"January|February|March|April|May|June|July|August|September|October|November|December)"
-    textual_date = rf"{day_text}\s*{month_text}\s+{year}"
-
-    # Combine patterns
-    date_pat = rf"(?:{numeric_date}|{textual_date})"
-
-    # Match "date to date"
-    rgx = re.compile(
-        rf"({date_pat}).{{0,40}}?\bto\b.{{0,40}}?({date_pat})",
-        re.IGNORECASE | re.DOTALL
-    )
+    t = _ZERO_WIDTH_CR_RE.sub(" ", text)
 
-    m = rgx.search(t)
+    m = _DATE_RANGE_RE.search(t)
     if not m:
         return None, None
 
-    def _normalize_date(s: str) -> str:
-        # Remove ordinal suffixes or OCR quotes
-        s = re.sub(r'(\d{1,2})(st|nd|rd|th|"|”)', r'\1', s, flags=re.IGNORECASE)
-        # Convert textual month to number
-        month_map = {
-            'jan':1,'feb':2,'mar':3,'apr':4,'may':5,'jun':6,
-            'jul':7,'aug':8,'sep':9,'oct':10,'nov':11,'dec':12
-        }
-        def replace_month(mo):
-            m = mo.group(0).lower()[:3]
-            return str(month_map[m])
-        s = re.sub(r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec|'
-                   r'January|February|March|April|May|June|July|August|September|October|November|December)',
-                   replace_month, s, flags=re.IGNORECASE)
-        # Replace separators/spaces with dot
-        s = re.sub(r"[\s\.\-]+", ".", s)
-        return s
-
     start, end = _normalize_date(m.group(1)), _normalize_date(m.group(2))
 
     return start, end
-
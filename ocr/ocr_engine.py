@@ -1,11 +1,69 @@
 from __future__ import annotations
 
-from typing import Optional
+import logging
+import os
+import subprocess
+import tempfile
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
 
 import pytesseract
 from PIL import Image
 import numpy as np  # type: ignore
 
+try:
+    import tesserocr  # type: ignore
+    TESSEROCR_AVAILABLE = True
+except ImportError:
+    TESSEROCR_AVAILABLE = False
+
+_log = logging.getLogger(__name__)
+
+# One tesserocr API per thread (and so per worker process): the engine and its
+# language model are loaded once instead of spawning tesseract.exe per page
+_api_local = threading.local()
+
+
+def _tessdata_dir(tesseract_cmd: Optional[str]) -> Optional[str]:
+    if not tesseract_cmd:
+        return None
+    path = os.path.join(os.path.dirname(tesseract_cmd), "tessdata")
+    return path if os.path.isdir(path) else None
+
+
+def _get_api(tesseract_cmd: Optional[str], psm: int, oem: int, lang: str):
+    apis: Dict[Tuple, object] = getattr(_api_local, "apis", None) or {}
+    _api_local.apis = apis
+    key = (_tessdata_dir(tesseract_cmd), psm, oem, lang)
+    if key in apis:
+        return apis[key]
+    try:
+        # PSM/OEM are plain int constants in tesserocr, not enums to construct
+        kwargs = {"lang": lang, "psm": psm, "oem": oem}
+        if key[0]:
+            kwargs["path"] = key[0]
+        api = tesserocr.PyTessBaseAPI(**kwargs)
+    except Exception as exc:
+        # e.g. no tessdata found; fall back to the executable for this config
+        _log.warning("tesserocr init failed (lang=%s, psm=%s, oem=%s): %s; using tesseract.exe", lang, psm, oem, exc)
+        api = None
+    apis[key] = api
+    return api
+
+
+def _to_pil(image: np.ndarray | Image.Image) -> Image.Image:
+    return image if isinstance(image, Image.Image) else Image.fromarray(image)
+
+
+def _save_bmp(image: np.ndarray | Image.Image, path: str) -> None:
+    # preprocess_image output is pure black/white; as a 1-bit BMP it is an eighth of
+    # the bytes tesseract.exe has to read back, with identical pixels
+    if isinstance(image, np.ndarray) and image.dtype == np.uint8 and image.ndim == 2:
+        if ((image == 0) | (image == 255)).all():
+            Image.fromarray(image > 127).save(path, format="BMP")
+            return
+    _to_pil(image).save(path, format="BMP")
+
 
 def ocr_image_to_text(
     image: np.ndarray | Image.Image,
@@ -14,16 +72,72 @@ def ocr_image_to_text(
     oem: int = 3,
     lang: str = "eng",
 ) -> str:
+    if TESSEROCR_AVAILABLE:
+        api = _get_api(tesseract_cmd, psm, oem, lang)
+        if api is not None:
+            api.SetImage(_to_pil(image))
+            return api.GetUTF8Text()
+
     if tesseract_cmd:
         pytesseract.pytesseract.tesseract_cmd = tesseract_cmd
 
-    if isinstance(image, Image.Image):
-        pil_img = image
-    else:
-        pil_img = Image.fromarray(image)
-
     config = f"--psm {psm} --oem {oem}"
-    text = pytesseract.image_to_string(pil_img, lang=lang, config=config)
+    # pytesseract would PNG-encode the page for tesseract.exe; an uncompressed BMP is
+    # much cheaper to write and read back
+    fd, tmp_path = tempfile.mkstemp(prefix="tess_", suffix=".bmp")
+    os.close(fd)
+    try:
+        _save_bmp(image, tmp_path)
+        text = pytesseract.image_to_string(tmp_path, lang=lang, config=config)
+    finally:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
     return text
 
 
+def ocr_images_to_texts(
+    images: Iterable[np.ndarray | Image.Image],
+    tesseract_cmd: Optional[str] = None,
+    psm: int = 6,
+    oem: int = 3,
+    lang: str = "eng",
+) -> List[str]:
+    """
+    OCR several images, starting the engine once. With tesserocr that is just the loaded
+    API in a loop; otherwise the pages are written to a temp folder and one tesseract.exe
+    reads them all from a list file, paying start-up and model load once instead of per
+    page. Falls back to one call per page if the batch run fails.
+    """
+    if TESSEROCR_AVAILABLE and _get_api(tesseract_cmd, psm, oem, lang) is not None:
+        return [ocr_image_to_text(img, tesseract_cmd, psm, oem, lang) for img in images]
+
+    if tesseract_cmd:
+        pytesseract.pytesseract.tesseract_cmd = tesseract_cmd
+    config = f"--psm {psm} --oem {oem}"
+    with tempfile.TemporaryDirectory(prefix="tess_") as tmp_dir:
+        paths: List[str] = []
+        for i, img in enumerate(images):
+            path = os.path.join(tmp_dir, f"page_{i:04d}.bmp")
+            _save_bmp(img, path)
+            paths.append(path)
+        if len(paths) > 1:
+            list_path = os.path.join(tmp_dir, "pages.txt")
+            with open(list_path, "w", encoding="utf-8") as fh:
+                fh.write("\n".join(paths) + "\n")
+            cmd = [pytesseract.pytesseract.tesseract_cmd, list_path, "stdout", "-l", lang, "--psm", str(psm), "--oem", str(oem)]
+            try:
+                proc = subprocess.run(
+                    cmd,
+                    capture_output=True,
+                    # No console window flashing up per PDF in the windowed build
+                    creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
+                )
+                # tesseract ends every page with a form feed
+                pages = proc.stdout.decode("utf-8", errors="replace").split("\x0c")
+                if proc.returncode == 0 and len(pages) > len(paths):
+                    return pages[:len(paths)]
+            except Exception:
+                pass
+        return [pytesseract.image_to_string(path, lang=lang, config=config) for path in paths]
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import itertools
+import os
+import sys
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, wait
+from typing import Callable, Dict, Hashable, Iterable, Iterator, Optional, Tuple
+
+
+def default_worker_count(n_tasks: int) -> int:
+    cpu = os.cpu_count() or 1
+    # OCR_CONCURRENCY overrides the core count, e.g. to leave cores free on a shared machine
+    try:
+        cpu = int(os.environ.get("OCR_CONCURRENCY", "")) or cpu
+    except ValueError:
+        pass
+    return max(1, min(cpu, n_tasks))
+
+
+_IN_WORKER = False
+
+
+def _init_worker() -> None:
+    global _IN_WORKER
+    _IN_WORKER = True
+    # Each worker already owns a core; Tesseract's OpenMP threads would only oversubscribe it
+    os.environ["OMP_THREAD_LIMIT"] = "1"
+    os.environ["OMP_NUM_THREADS"] = "1"
+    _lower_priority()
+
+
+def _lower_priority() -> None:
+    # Workers fill every core; below-normal priority (inherited by tesseract.exe) keeps
+    # the Tk window responsive meanwhile
+    try:
+        if sys.platform == "win32":
+            import ctypes
+
+            BELOW_NORMAL_PRIORITY_CLASS = 0x4000
+            kernel32 = ctypes.windll.kernel32  # type: ignore[attr-defined]
+            kernel32.SetPriorityClass(kernel32.GetCurrentProcess(), BELOW_NORMAL_PRIORITY_CLASS)
+        else:
+            os.nice(10)
+    except Exception:
+        pass
+
+
+def render_thread_count() -> int:
+    """Poppler render threads: all cores (capped) in-process, one inside a pool worker."""
+    if _IN_WORKER:
+        return 1
+    return max(1, min(os.cpu_count() or 1, 8))
+
+
+def make_process_pool(n_tasks: int, max_workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """
+    Process pool for running independent OCR jobs (one PDF per task) in parallel.
+
+    Submitted callables must be top-level functions (picklable) and must not
+    capture GUI objects; progress is reported by the caller as futures complete.
+    """
+    workers = max_workers or default_worker_count(n_tasks)
+    return ProcessPoolExecutor(max_workers=workers, initializer=_init_worker)
+
+
+def iter_completed(
+    pool: Executor,
+    fn: Callable[..., object],
+    jobs: Iterable[Tuple[Hashable, tuple]],
+    max_pending: int,
+) -> Iterator[Tuple[Hashable, Future]]:
+    """
+    Submit fn(*args) for each (key, args) job and yield (key, future) as each one finishes.
+
+    Jobs are pulled from the iterable only as slots free up, so at most max_pending
+    futures (and their pickled arguments) are queued at once however many PDFs there are,
+    and a consumer that stops early leaves the rest unsubmitted.
+    """
+    it = iter(jobs)
+    pending: Dict[Future, Hashable] = {}
+
+    def _fill() -> None:
+        for key, args in itertools.islice(it, max(1, max_pending) - len(pending)):
+            pending[pool.submit(fn, *args)] = key
+
+    _fill()
+    while pending:
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for fut in done:
+            yield pending.pop(fut), fut
+        _fill()
@@ -1,30 +1,148 @@
 from __future__ import annotations
 
+import os
+import sys
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, List, Optional, Sequence
 
+import numpy as np  # type: ignore
 from PIL import Image
-from pdf2image import convert_from_path
+from pdf2image import convert_from_path, pdfinfo_from_path
+
+from .parallel import render_thread_count
+
+try:
+    import fitz  # type: ignore  # PyMuPDF
+    FITZ_AVAILABLE = True
+except ImportError:
+    FITZ_AVAILABLE = False
+
+
+def _render_fitz(pdf_path: str, dpi: int, grayscale: bool, page_numbers: Optional[Sequence[int]] = None) -> Iterator[np.ndarray]:
+    # MuPDF rasterizes in-process: no pdftoppm start-up and no PPM bytes piped back.
+    # The pixmap's samples become the ndarray preprocess_image works on, with no PIL step.
+    with fitz.open(pdf_path) as doc:
+        numbers = range(1, doc.page_count + 1) if page_numbers is None else page_numbers
+        colorspace = fitz.csGRAY if grayscale else fitz.csRGB
+        for number in numbers:
+            pix = doc[number - 1].get_pixmap(dpi=dpi, colorspace=colorspace, alpha=False)
+            shape = (pix.height, pix.width) if pix.n == 1 else (pix.height, pix.width, pix.n)
+            # Rows may be padded past width * n bytes; the stride keeps them aligned
+            page = np.frombuffer(pix.samples, dtype=np.uint8).reshape(pix.height, pix.stride)
+            yield page[:, : pix.width * pix.n].reshape(shape)
 
 
 def convert_pdf_to_images(
     pdf_path: str | Path,
     dpi: int = 300,
     poppler_path: Optional[str] = None,
-) -> List[Image.Image]:
+    thread_count: Optional[int] = None,
+    grayscale: bool = False,
+) -> List[Image.Image | np.ndarray]:
+    """
+    Render every page. With PyMuPDF installed the pages are ndarrays rendered in-process;
+    otherwise PIL images from Poppler (``poppler_path``, ``thread_count``).
+    """
     pdf_path = str(pdf_path)
-    images = convert_from_path(pdf_path, dpi=dpi, poppler_path=poppler_path)
+    if FITZ_AVAILABLE:
+        return list(_render_fitz(pdf_path, dpi, grayscale))
+    images = convert_from_path(
+        pdf_path,
+        dpi=dpi,
+        poppler_path=poppler_path,
+        thread_count=thread_count or render_thread_count(),
+        grayscale=grayscale,
+    )
     return images
 
 
+def pdf_page_count(pdf_path: str | Path, poppler_path: Optional[str] = None) -> int:
+    if FITZ_AVAILABLE:
+        with fitz.open(str(pdf_path)) as doc:
+            return doc.page_count
+    return int(pdfinfo_from_path(str(pdf_path), poppler_path=poppler_path)["Pages"])
+
+
+def iter_pdf_pages(
+    pdf_path: str | Path,
+    dpi: int = 300,
+    poppler_path: Optional[str] = None,
+    grayscale: bool = False,
+    n_pages: Optional[int] = None,
+    page_numbers: Optional[Sequence[int]] = None,
+) -> Iterator[Image.Image | np.ndarray]:
+    """
+    Yield rendered pages in order. With PyMuPDF installed each page is rendered in-process
+    as an ndarray when it is asked for. Otherwise a few pages are rendered per Poppler
+    call (one per render thread) so only that many page bitmaps are alive at a time.
+
+    ``page_numbers`` (1-based, ascending) limits rendering to those pages.
+    """
+    pdf_path = str(pdf_path)
+    if FITZ_AVAILABLE:
+        if page_numbers is None and n_pages is not None:
+            page_numbers = range(1, n_pages + 1)
+        yield from _render_fitz(pdf_path, dpi, grayscale, page_numbers)
+        return
+    if page_numbers is None:
+        if n_pages is None:
+            n_pages = pdf_page_count(pdf_path, poppler_path=poppler_path)
+        page_numbers = range(1, n_pages + 1)
+    step = render_thread_count()
+    wanted = list(page_numbers)
+    i = 0
+    while i < len(wanted):
+        # Extend the run while pages are consecutive, up to one page per render thread
+        j = i + 1
+        while j < len(wanted) and j - i < step and wanted[j] == wanted[j - 1] + 1:
+            j += 1
+        first, last = wanted[i], wanted[j - 1]
+        i = j
+        batch = convert_from_path(
+            pdf_path,
+            dpi=dpi,
+            poppler_path=poppler_path,
+            first_page=first,
+            last_page=last,
+            thread_count=step,
+            grayscale=grayscale,
+        )
+        batch.reverse()
+        while batch:
+            # pop so the caller holds the only reference once it moves on
+            yield batch.pop()
+
+
 def collect_pdfs_in_folder(folder_path: str | Path) -> List[Path]:
-    folder = Path(folder_path)
-    unique: dict[str, Path] = {}
-    candidates = list(folder.glob("*.pdf")) + list(folder.glob("*.PDF"))
-    for p in candidates:
-        if p.is_file():
-            key = str(p.resolve()).lower()
-            unique[key] = p
-    return sorted(unique.values(), key=lambda x: x.name.lower())
+    # One directory listing; DirEntry.is_file() reuses the type info from the listing
+    folder = os.fspath(folder_path)
+    found: List[Path] = []
+    try:
+        with os.scandir(folder) as it:
+            for entry in it:
+                if entry.name.lower().endswith(".pdf") and entry.is_file():
+                    found.append(Path(entry.path))
+    except OSError:
+        return []
+    return sorted(found, key=lambda x: x.name.lower())
+
+
+_MFT_RECORD_MASK = (1 << 48) - 1
+
 
+def sort_for_disk_locality(paths: List[Path]) -> List[Path]:
+    """
+    Order files by inode (the NTFS MFT record number on Windows) so a batch reads them in
+    roughly on-disk order. Files without an inode follow, by ascending size.
+    """
+    def _key(p: Path) -> tuple[int, int]:
+        try:
+            st = os.stat(p)
+        except OSError:
+            return (2, 0)
+        if not st.st_ino:
+            return (1, st.st_size)
+        # NTFS file reference: the top 16 bits are the slot's reuse count, not its position
+        return (0, st.st_ino & _MFT_RECORD_MASK if sys.platform == "win32" else st.st_ino)
 
+    return sorted(paths, key=_key)
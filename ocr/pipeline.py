@@ -1,35 +1,120 @@
 from __future__ import annotations
 
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Callable, Dict, Iterable, List, Optional
+from typing import Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np  # type: ignore
+from PIL import Image
 
 from .models import ExtractionResult
-from .pdf import convert_pdf_to_images
-from .preprocess import preprocess_image
-from .ocr_engine import ocr_image_to_text
+from .parallel import render_thread_count
+from .pdf import iter_pdf_pages, pdf_page_count
+from .preprocess import MAX_PAGE_SIDE, preprocess_image
+from .ocr_engine import ocr_image_to_text, ocr_images_to_texts
+from .text_layer import read_text_layer
 from .extract import extract_fields, extract_address_between_markers, extract_date_range
 
 
+def _ocr_page(pil_img: Image.Image | np.ndarray, tesseract_cmd: Optional[str], max_side: Optional[int] = MAX_PAGE_SIDE) -> str:
+    return ocr_image_to_text(preprocess_image(pil_img, max_side=max_side), tesseract_cmd=tesseract_cmd)
+
+
+def _ocr_pages_threaded(
+    pages: Iterable[Image.Image | np.ndarray],
+    tesseract_cmd: Optional[str],
+    threads: int,
+    max_side: Optional[int] = MAX_PAGE_SIDE,
+) -> Iterator[str]:
+    """
+    OCR pages on a thread pool and yield their texts in page order. Tesseract (either
+    tesserocr or the tesseract.exe subprocess) and OpenCV release the GIL, so pages
+    overlap; at most 2 * threads rendered pages are held at once.
+    """
+    with ThreadPoolExecutor(max_workers=threads) as ex:
+        window: Deque[Future] = deque()
+        for pil_img in pages:
+            window.append(ex.submit(_ocr_page, pil_img, tesseract_cmd, max_side))
+            if len(window) >= 2 * threads:
+                yield window.popleft().result()
+        while window:
+            yield window.popleft().result()
+
+
+def _ocr_pages_batched(
+    pages: Iterable[Image.Image | np.ndarray],
+    tesseract_cmd: Optional[str],
+    max_side: Optional[int] = MAX_PAGE_SIDE,
+) -> Iterator[str]:
+    # A generator, so the batch only starts when the first OCR'd page is needed
+    yield from ocr_images_to_texts(
+        (preprocess_image(pil_img, max_side=max_side) for pil_img in pages), tesseract_cmd=tesseract_cmd
+    )
+
+
+def iter_page_texts(
+    pdf_path: str | Path,
+    tesseract_cmd: Optional[str] = None,
+    poppler_path: Optional[str] = None,
+    log: Optional[Callable[[str], None]] = None,
+    stream: bool = True,
+    dpi: int = 300,
+    max_side: Optional[int] = MAX_PAGE_SIDE,
+) -> Iterator[Tuple[int, int, str]]:
+    """
+    Yield ``(page_number, total_pages, text)`` in page order. Pages with a usable
+    embedded text layer are taken as-is; only the rest are rendered and OCR'd.
+    With ``stream=False`` the caller only wants the whole document, so a single-threaded
+    run may OCR all pages in one engine start before the first OCR'd page is yielded.
+    Pages are rendered at ``dpi`` and shrunk to ``max_side`` pixels before OCR if larger.
+    """
+    name = Path(pdf_path).name
+    layer = read_text_layer(pdf_path)
+    if layer is None:
+        total = pdf_page_count(pdf_path, poppler_path=poppler_path)
+        layer = [None] * total
+    total = len(layer)
+    need_ocr = [idx for idx, text in enumerate(layer, start=1) if text is None]
+    if log and need_ocr:
+        log(f"Converting PDF to images: {name}")
+    pil_pages = iter_pdf_pages(
+        pdf_path, dpi=dpi, poppler_path=poppler_path, grayscale=True, page_numbers=need_ocr
+    )
+    # In-process (single PDF) the pages are spread over threads; a pool worker
+    # already has one PDF per core and OCRs its pages one by one
+    threads = min(render_thread_count(), len(need_ocr))
+    if threads > 1:
+        ocr_texts = _ocr_pages_threaded(pil_pages, tesseract_cmd, threads, max_side)
+    elif not stream and len(need_ocr) > 1:
+        ocr_texts = _ocr_pages_batched(pil_pages, tesseract_cmd, max_side)
+    else:
+        ocr_texts = (_ocr_page(pil_img, tesseract_cmd, max_side) for pil_img in pil_pages)
+
+    for idx, text in enumerate(layer, start=1):
+        if text is None:
+            if log:
+                log(f"Running OCR on page {idx} of {total} for {name}")
+            text = next(ocr_texts)
+        elif log:
+            log(f"Using embedded text for page {idx} of {total} for {name}")
+        yield idx, total, text
+
+
 def ocr_pdf_to_text(
     pdf_path: str | Path,
     tesseract_cmd: Optional[str] = None,
     poppler_path: Optional[str] = None,
     on_page: Optional[Callable[[str, int, int], None]] = None,
     log: Optional[Callable[[str], None]] = None,
+    dpi: int = 300,
+    max_side: Optional[int] = MAX_PAGE_SIDE,
 ) -> str:
-    if log:
-        log(f"Converting PDF to images: {Path(pdf_path).name}")
-    pil_pages = convert_pdf_to_images(pdf_path, dpi=300, poppler_path=poppler_path)
-
-    total = len(pil_pages)
     all_text_parts: List[str] = []
-    for idx, pil_img in enumerate(pil_pages, start=1):
-        if log:
-            log(f"Preprocessing page {idx} of {total} for {Path(pdf_path).name}")
-        pre = preprocess_image(pil_img)
-        if log:
-            log(f"Running OCR on page {idx} of {total} for {Path(pdf_path).name}")
-        page_text = ocr_image_to_text(pre, tesseract_cmd=tesseract_cmd)
+    pages = iter_page_texts(
+        pdf_path, tesseract_cmd, poppler_path, log, stream=on_page is not None, dpi=dpi, max_side=max_side
+    )
+    for idx, total, page_text in pages:
         all_text_parts.append(page_text)
         if on_page:
             try:
@@ -46,22 +131,17 @@ def process_pdf_file(
     poppler_path: Optional[str] = None,
     log: Optional[Callable[[str], None]] = None,
     patterns: Optional[Dict[str, Iterable[str]]] = None,
+    dpi: int = 300,
+    max_side: Optional[int] = MAX_PAGE_SIDE,
 ) -> ExtractionResult:
     file_name = Path(pdf_path).name
     try:
-        if log:
-            log(f"Converting PDF to images: {file_name}")
-        pil_pages = convert_pdf_to_images(pdf_path, dpi=300, poppler_path=poppler_path)
-
-        all_text_parts: List[str] = []
-        for idx, pil_img in enumerate(pil_pages, start=1):
-            if log:
-                log(f"Preprocessing page {idx} of {file_name}")
-            pre = preprocess_image(pil_img)
-            if log:
-                log(f"Running OCR on page {idx} of {file_name}")
-            txt = ocr_image_to_text(pre, tesseract_cmd=tesseract_cmd)
-            all_text_parts.append(txt)
+        all_text_parts: List[str] = [
+            txt
+            for _, _, txt in iter_page_texts(
+                pdf_path, tesseract_cmd, poppler_path, log, stream=False, dpi=dpi, max_side=max_side
+            )
+        ]
 
         full_text = "\n".join(all_text_parts)
         license_id, date, reference_id = extract_fields(full_text, patterns=patterns)
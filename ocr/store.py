@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+import tempfile
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+class OCRStore:
+    """
+    OCR text of a batch kept in an SQLite file instead of in memory, keyed by the PDF's
+    position in the batch. Without a path a temp file is used and deleted on close().
+
+    Written by one thread at a time; reads may come from another thread once writing is done.
+    """
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        self._owns_file = path is None
+        if path is None:
+            fd, path = tempfile.mkstemp(prefix="ocr_texts_", suffix=".sqlite3")
+            os.close(fd)
+        self.path = path
+        # Autocommit: each PDF's text is durable as soon as it is stored
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS texts (idx INTEGER PRIMARY KEY, file_name TEXT NOT NULL, text TEXT NOT NULL)"
+        )
+
+    def put(self, idx: int, file_name: str, text: str) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO texts (idx, file_name, text) VALUES (?, ?, ?)", (idx, file_name, text or "")
+        )
+
+    def get(self, idx: int) -> str:
+        row = self._conn.execute("SELECT text FROM texts WHERE idx = ?", (idx,)).fetchone()
+        return row[0] if row else ""
+
+    def keys(self) -> List[Tuple[int, str]]:
+        """(idx, file name) of every stored PDF, in batch order."""
+        return self._conn.execute("SELECT idx, file_name FROM texts ORDER BY idx").fetchall()
+
+    def iter_rows(self) -> Iterator[Dict[str, str]]:
+        """``{"File Name", "Text"}`` rows in batch order, read one at a time."""
+        for file_name, text in self._conn.execute("SELECT file_name, text FROM texts ORDER BY idx"):
+            yield {"File Name": file_name, "Text": text}
+
+    def text_length(self) -> int:
+        """Characters of text stored over all PDFs."""
+        return self._conn.execute("SELECT COALESCE(SUM(LENGTH(text)), 0) FROM texts").fetchone()[0]
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM texts").fetchone()[0]
+
+    def close(self) -> None:
+        try:
+            self._conn.close()
+        except Exception:
+            pass
+        if self._owns_file:
+            for suffix in ("", "-wal", "-shm"):
+                try:
+                    os.remove(self.path + suffix)
+                except OSError:
+                    pass
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import List, Optional
+
+try:
+    from pypdf import PdfReader  # type: ignore
+    PYPDF_AVAILABLE = True
+except ImportError:
+    PYPDF_AVAILABLE = False
+
+# A page counts as born-digital when its text layer has at least this many printable ASCII characters
+MIN_TEXT_LAYER_CHARS = 200
+
+
+def _usable(text: str) -> bool:
+    return sum(1 for c in text if "!" <= c <= "~") >= MIN_TEXT_LAYER_CHARS
+
+
+def read_text_layer(pdf_path: str | Path) -> Optional[List[Optional[str]]]:
+    """
+    Embedded text per page, with None for pages that still need OCR (scans, or too
+    little text to trust). Returns None when pypdf is not installed or the file
+    can't be read, in which case every page is OCR'd as before.
+    """
+    if not PYPDF_AVAILABLE:
+        return None
+    try:
+        reader = PdfReader(str(pdf_path))
+        out: List[Optional[str]] = []
+        for page in reader.pages:
+            try:
+                text = page.extract_text() or ""
+            except Exception:
+                text = ""
+            out.append(text if _usable(text) else None)
+        return out
+    except Exception:
+        return None
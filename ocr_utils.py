@@ -13,31 +13,42 @@ from typing import Callable, Dict, Iterable, List, Optional, Tuple
 from ocr import (
     ExtractionResult,
     convert_pdf_to_images,
+    iter_pdf_pages,
+    pdf_page_count,
     preprocess_image,
     ocr_image_to_text,
+    ocr_images_to_texts,
 )
 from ocr import (
     DEFAULT_PATTERNS,
     compile_patterns,
     extract_first_match,
+    make_first_match,
     extract_fields,
 )
 from ocr import (
     ocr_pdf_to_text,
+    iter_page_texts,
+    read_text_layer,
     process_pdf_file,
     collect_pdfs_in_folder,
+    sort_for_disk_locality,
 )
 from ocr import append_rows_csv
+from ocr import OCRStore
+from ocr import make_process_pool, default_worker_count, iter_completed
 from ocr import postprocess_results
 from ocr import (
     generate_smart_patterns,
     extract_dynamic_fields,
+    compile_field_patterns,
     generate_window_patterns,
     infer_token_shape,
     normalize_text_for_license,
     extract_all_license_numbers,
     bulk_extract,
     bulk_extract_licenses,
+    make_extract_pool,
     extract_address_between_markers,
     extract_date_range,
 )
@@ -45,25 +56,38 @@ from ocr import (
 __all__ = [
     "ExtractionResult",
     "convert_pdf_to_images",
+    "iter_pdf_pages",
+    "pdf_page_count",
     "preprocess_image",
     "ocr_image_to_text",
+    "ocr_images_to_texts",
     "DEFAULT_PATTERNS",
     "compile_patterns",
     "extract_first_match",
+    "make_first_match",
     "extract_fields",
     "ocr_pdf_to_text",
+    "iter_page_texts",
+    "read_text_layer",
     "process_pdf_file",
     "collect_pdfs_in_folder",
+    "sort_for_disk_locality",
     "append_rows_csv",
+    "OCRStore",
+    "make_process_pool",
+    "default_worker_count",
+    "iter_completed",
     "postprocess_results",
     "generate_smart_patterns",
     "extract_dynamic_fields",
+    "compile_field_patterns",
     "generate_window_patterns",
     "infer_token_shape",
     "normalize_text_for_license",
     "extract_all_license_numbers",
     "bulk_extract",
     "bulk_extract_licenses",
+    "make_extract_pool",
     "extract_address_between_markers",
     "extract_date_range",
     
@@ -7,6 +7,7 @@ This approach is much more accurate than regex for variable document structures.
 
 from __future__ import annotations
 
+import functools
 import os
 import re
 from typing import Dict, List, Optional, Tuple
@@ -31,6 +32,9 @@ class T5Extractor:
         self.model_path = model_path
         self.model = None
         self.tokenizer = None
+        # Model file state (see _model_file_state) when loading last failed; a retry only
+        # happens once the file appears or changes, not on every batch
+        self._failed_file_state: Optional[Tuple] = None
         self.device = "cuda" if T5_AVAILABLE and tf.config.list_physical_devices('GPU') else "cpu"
         
     def load_model(self) -> bool:
@@ -60,6 +64,13 @@ class T5Extractor:
             print(f"Error loading T5 model: {e}")
             return False
     
+    def _model_file_state(self) -> Tuple:
+        try:
+            st = os.stat(self.model_path)
+        except OSError:
+            return (False,)
+        return (True, st.st_mtime_ns, st.st_size)
+
     def extract_fields(self, text: str, field_types: List[str]) -> Dict[str, Optional[str]]:
         """
         Extract specified fields from OCR text using T5 model.
@@ -71,42 +82,60 @@ class T5Extractor:
         Returns:
             Dictionary with extracted field values
         """
+        # All fields in one generate() call rather than one call per field
+        return self.extract_fields_batch([text], field_types)[0]
+    
+    def extract_fields_batch(
+        self,
+        texts: List[str],
+        field_types: List[str],
+        batch_size: int = 8,
+    ) -> List[Dict[str, Optional[str]]]:
+        """
+        Extract fields from several documents, running one padded generate()
+        call for every (document, field) prompt of up to ``batch_size`` documents.
+
+        Returns one result dictionary per input text, in input order.
+        """
+        results: List[Dict[str, Optional[str]]] = [{} for _ in texts]
+        if not texts or not field_types:
+            return results
         if not self.model or not self.tokenizer:
-            if not self.load_model():
-                return {field: None for field in field_types}
-        
-        results = {}
-        
-        for field_type in field_types:
+            state = self._model_file_state()
+            if self._failed_file_state == state or not self.load_model():
+                self._failed_file_state = state
+                return [{field: None for field in field_types} for _ in texts]
+
+        for start in range(0, len(texts), batch_size):
+            pairs = [(idx, field_type) for idx in range(start, min(start + batch_size, len(texts))) for field_type in field_types]
             try:
-                # Create input prompt for T5
-                prompt = self._create_prompt(text, field_type)
-                
-                # Tokenize input
-                inputs = self.tokenizer.encode(prompt, return_tensors="tf", max_length=512, truncation=True)
-                
-                # Generate output
+                prompts = [self._create_prompt(texts[idx], field_type) for idx, field_type in pairs]
+                inputs = self.tokenizer(
+                    prompts,
+                    return_tensors="tf",
+                    max_length=512,
+                    truncation=True,
+                    padding=True,
+                )
                 outputs = self.model.generate(
-                    inputs,
+                    inputs["input_ids"],
+                    attention_mask=inputs["attention_mask"],
                     max_length=50,
                     num_beams=4,
                     early_stopping=True,
                     temperature=0.1
                 )
-                
-                # Decode output
-                extracted_text = self.tokenizer.decode(outputs[0], skip_special_tokens=True)
-                
-                # Clean and validate extracted text
-                cleaned_text = self._clean_extracted_text(extracted_text, field_type)
-                results[field_type] = cleaned_text if cleaned_text else None
-                
+                decoded = self.tokenizer.batch_decode(outputs, skip_special_tokens=True)
+                for (idx, field_type), extracted_text in zip(pairs, decoded):
+                    cleaned_text = self._clean_extracted_text(extracted_text, field_type)
+                    results[idx][field_type] = cleaned_text if cleaned_text else None
             except Exception as e:
-                print(f"Error extracting {field_type}: {e}")
-                results[field_type] = None
-        
+                print(f"Error extracting {', '.join(field_types)}: {e}")
+                for idx, field_type in pairs:
+                    results[idx][field_type] = None
+
         return results
-    
+
     def _create_prompt(self, text: str, field_type: str) -> str:
         """
         Create a prompt for T5 model to extract specific field.
@@ -183,10 +212,32 @@ def extract_with_context_t5(
     Returns:
         Dictionary with extracted field values
     """
-    extractor = T5Extractor(model_path)
+    extractor = get_t5_extractor(model_path)
     return extractor.extract_fields(text, field_types)
 
 
+def extract_with_context_t5_batch(
+    texts: List[str],
+    field_types: List[str],
+    model_path: str = "tf_model.h5",
+    batch_size: int = 8,
+) -> List[Dict[str, Optional[str]]]:
+    """
+    Batched variant of extract_with_context_t5: one result dictionary per text.
+    """
+    extractor = get_t5_extractor(model_path)
+    return extractor.extract_fields_batch(texts, field_types, batch_size=batch_size)
+
+
+@functools.lru_cache(maxsize=None)
+def get_t5_extractor(model_path: str = "tf_model.h5") -> T5Extractor:
+    """
+    Shared extractor per model path, so the weights are loaded once per process
+    instead of once per document.
+    """
+    return T5Extractor(model_path)
+
+
 # Example usage and testing
 if __name__ == "__main__":
     # Test the extractor